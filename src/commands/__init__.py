@@ -0,0 +1,9 @@
+"""CLI subcommands for ls-arch-validator.
+
+Each module exposes a ``cmd`` Click command and is imported on demand by
+the root group in ``src.cli`` so that only the invoked command is built.
+"""
+
+COMMANDS = ("mine", "generate", "validate", "report", "run", "status", "clean")
+
+__all__ = ["COMMANDS"]
@@ -0,0 +1,169 @@
+"""Clean command - prune cached data and old runs."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+
+import click
+
+from src.commands.common import Context, output_json, pass_context
+from src.utils.cache import AppCache, ArchitectureCache, get_dir_size, get_sizes_bulk
+
+_DRY_RUN = {"status": "dry_run", "message": "Would clean cache"}
+
+
+def _remove_run_item(path: str, is_dir: bool) -> Optional[int]:
+    """
+    Remove a run file or directory.
+
+    Args:
+        path: Path of the run item
+        is_dir: Whether the item is a directory
+
+    Returns:
+        Bytes freed, or None if the item could not be removed
+    """
+    try:
+        if is_dir:
+            size = get_dir_size(path)
+            shutil.rmtree(path)
+        else:
+            size = os.stat(path, follow_symlinks=False).st_size
+            os.unlink(path)
+    except OSError:
+        return None
+    return size
+
+
+@click.command()
+@click.option("--architectures", is_flag=True, help="Clean cached architectures")
+@click.option("--apps", is_flag=True, help="Clean cached sample apps")
+@click.option("--runs", is_flag=True, help="Clean old run results")
+@click.option("--all", "clean_all", is_flag=True, help="Clean everything")
+@click.option(
+    "--retention-days",
+    type=int,
+    default=90,
+    help="Days of run history to keep (default: 90 per FR-052)",
+)
+@click.option(
+    "--max-size-gb",
+    type=float,
+    default=10.0,
+    help="Maximum cache size in GB (default: 10 per FR-052)",
+)
+@pass_context
+def clean(
+    ctx: Context,
+    architectures: bool,
+    apps: bool,
+    runs: bool,
+    clean_all: bool,
+    retention_days: int,
+    max_size_gb: float,
+) -> None:
+    """Clean cache and state with retention policies."""
+    if ctx.dry_run:
+        output_json({
+            **_DRY_RUN,
+            "architectures": architectures or clean_all,
+            "apps": apps or clean_all,
+            "runs": runs or clean_all,
+            "retention_days": retention_days,
+            "max_size_gb": max_size_gb,
+        })
+        return
+
+    cleaned = {
+        "architectures": 0,
+        "apps": 0,
+        "runs": 0,
+        "bytes_freed": 0,
+        "bytes_evicted": 0,
+    }
+
+    # Clean runs based on retention period
+    if runs or clean_all:
+        runs_dir = ctx.output_dir / "data" / "runs"
+        if runs_dir.exists():
+            # A run dated D (midnight) is expired once D < now - retention;
+            # dates are built from the YYYYMMDD digits directly
+            cutoff = datetime.now() - timedelta(days=retention_days)
+            victims: list[tuple[str, bool]] = []
+            with os.scandir(runs_dir) as entries:
+                for entry in entries:
+                    # Handle both directories and JSON files
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    name = entry.name if is_dir else entry.name.rsplit(".", 1)[0]
+                    parts = name.split("-", 2)
+                    if len(parts) < 2:
+                        continue
+                    date_str = parts[1]
+                    if len(date_str) != 8 or not date_str.isdigit():
+                        continue
+                    try:
+                        run_date = datetime(
+                            int(date_str[:4]), int(date_str[4:6]), int(date_str[6:])
+                        )
+                    except ValueError:
+                        continue
+                    if run_date < cutoff:
+                        victims.append((entry.path, is_dir))
+
+            # Overlap the unlink work of removing many run directories
+            if victims:
+                with ThreadPoolExecutor(max_workers=min(8, len(victims))) as executor:
+                    for size in executor.map(_remove_run_item, *zip(*victims)):
+                        if size is not None:
+                            cleaned["runs"] += 1
+                            cleaned["bytes_freed"] += size
+
+    # Clean caches
+    arch_cache = ArchitectureCache(ctx.cache_dir)
+    app_cache = AppCache(ctx.cache_dir)
+
+    if architectures or clean_all:
+        cleaned["architectures"] = arch_cache.clear()
+
+    if apps or clean_all:
+        cleaned["apps"] = app_cache.clear()
+
+    # Enforce storage cap; the total is measured once and then tracked
+    # from the bytes each eviction frees
+    sizes = get_sizes_bulk(ctx.cache_dir)
+    total_size = sizes.get("architectures", 0) + sizes.get("apps", 0)
+    max_bytes = int(max_size_gb * 1024 * 1024 * 1024)
+
+    if total_size > max_bytes:
+        ctx.logger.warning(
+            "storage_cap_exceeded",
+            current_gb=round(total_size / (1024**3), 2),
+            max_gb=max_size_gb,
+        )
+        # Clear older items until under cap
+        # Start with apps, then architectures; once a cache has nothing
+        # left to evict it is not scanned again
+        for cache, kind in ((app_cache, "apps"), (arch_cache, "architectures")):
+            while total_size > max_bytes:
+                evicted = cache.evict_oldest()
+                if not evicted:
+                    break
+                cleaned[kind] += 1
+                cleaned["bytes_evicted"] += evicted[1]
+                total_size -= evicted[1]
+
+    output_json({
+        "status": "success",
+        "cleaned": cleaned,
+        "current_size_mb": round(total_size / (1024 * 1024), 2),
+    })
+
+
+cmd = clean
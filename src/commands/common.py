@@ -0,0 +1,305 @@
+"""Shared CLI context and output helpers."""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Coroutine, Optional, TypeVar
+
+import click
+
+from src.config import PipelineConfig
+from src.models import (
+    Architecture,
+    ArchitectureMetadata,
+    ArchitectureSourceType,
+    PipelineStatus,
+)
+from src.utils.jsonio import dumps
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from src.utils.cache import ArchitectureCache
+
+T = TypeVar("T")
+
+# Dashboard templates shipped with the package, else ./templates
+PACKAGE_TEMPLATES_DIR = Path(__file__).resolve().parents[2] / "templates"
+TEMPLATES_DIR = (
+    PACKAGE_TEMPLATES_DIR if PACKAGE_TEMPLATES_DIR.is_dir() else Path("templates")
+)
+
+_cli_logger: Any = None
+_reporter: Optional[ModuleType] = None
+
+
+def get_cli_logger() -> Any:
+    """Get the shared "cli" logger, creating it on first use."""
+    global _cli_logger
+    if _cli_logger is None:
+        from src.utils.logging import get_logger
+
+        _cli_logger = get_logger("cli")
+    return _cli_logger
+
+
+def get_reporter() -> ModuleType:
+    """Get the ``src.reporter`` package, importing it on first use."""
+    global _reporter
+    if _reporter is None:
+        _reporter = importlib.import_module("src.reporter")
+    return _reporter
+
+
+@dataclass(slots=True)
+class Context:
+    """CLI context for sharing state between commands."""
+
+    config_dir: Path
+    cache_dir: Path
+    output_dir: Path
+    log_level: str
+    log_format: str
+    dry_run: bool
+    pipeline_config: Optional[PipelineConfig] = None
+    pipeline_status: PipelineStatus = PipelineStatus.PENDING
+
+    @property
+    def logger(self) -> Any:
+        """Shared CLI logger, created on first access."""
+        return get_cli_logger()
+
+    def ensure_dirs(self, *paths: Path) -> None:
+        """
+        Create directories a command writes to, skipping existing ones.
+
+        Args:
+            *paths: Directories to create (default: cache and output)
+        """
+        for path in paths or (self.cache_dir, self.output_dir):
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
+
+
+pass_context = click.make_pass_decorator(Context)
+
+
+def output_json(data: dict) -> None:
+    """Output JSON to stdout, pretty-printed only for terminals."""
+    stream = sys.stdout
+    payload = dumps(data, indent=stream.isatty(), newline=True)
+    stream.flush()
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Redirected to an in-memory stream (e.g. click's CliRunner)
+        stream.buffer.write(payload)
+        stream.buffer.flush()
+        return
+
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+# Enum lookup by value without the ValueError/_missing_ path
+_SOURCE_TYPES = {member.value: member for member in ArchitectureSourceType}
+
+
+def arch_from_cached(arch_id: str, cached: dict) -> Architecture:
+    """
+    Build an Architecture from an ``ArchitectureCache.load_architecture`` dict.
+
+    Unknown or missing source types fall back to ``TEMPLATE``.
+
+    Args:
+        arch_id: Architecture identifier
+        cached: Dictionary returned by the cache
+
+    Returns:
+        Architecture instance
+    """
+    meta_dict = cached.get("metadata") or {}
+    metadata = ArchitectureMetadata.from_dict(meta_dict) if meta_dict else None
+
+    source_type_str = cached.get("source_type") or "template"
+    source_type = _SOURCE_TYPES.get(source_type_str)
+    if source_type is None:
+        get_cli_logger().warning(
+            "invalid_source_type",
+            arch_id=arch_id,
+            source_type=source_type_str,
+        )
+        source_type = ArchitectureSourceType.TEMPLATE
+
+    # Positional in field order; content_hash follows the timestamp fields
+    return Architecture(
+        arch_id,
+        source_type,
+        cached.get("source_name", "cached"),
+        cached.get("source_url", ""),
+        cached.get("main_tf", ""),
+        cached.get("variables_tf"),
+        cached.get("outputs_tf"),
+        metadata,
+        content_hash=meta_dict.get("content_hash", ""),
+    )
+
+
+class LazyArchMap(Mapping[str, Architecture]):
+    """
+    Read-only architecture mapping that loads cached entries on demand.
+
+    Keys and membership come from the id list alone. An Architecture is
+    built from the cache the first time it is looked up, and iterating
+    items or values loads every remaining entry in one bulk pass. Entries
+    that fail to load are logged and dropped from the mapping.
+
+    Loading is serialized by an internal lock, so ``prefetch`` may run in a
+    worker thread (see ``asyncio.to_thread``) while the owning thread looks
+    entries up.
+    """
+
+    def __init__(
+        self,
+        cache: ArchitectureCache,
+        ids: Iterable[str],
+        built: Optional[Mapping[str, Architecture]] = None,
+    ) -> None:
+        """
+        Initialize the mapping.
+
+        Args:
+            cache: Architecture cache to load entries from
+            ids: Cached architecture IDs
+            built: Architectures that are already loaded (take precedence)
+        """
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._built: dict[str, Architecture] = dict(built or {})
+        self._ids: dict[str, None] = dict.fromkeys(self._built)
+        self._ids.update(dict.fromkeys(ids))
+
+    def __getitem__(self, arch_id: str) -> Architecture:
+        arch = self._built.get(arch_id)
+        if arch is not None:
+            return arch
+
+        with self._lock:
+            # A concurrent prefetch may have built or dropped it meanwhile
+            arch = self._built.get(arch_id)
+            if arch is not None:
+                return arch
+            if arch_id not in self._ids:
+                raise KeyError(arch_id)
+
+            cached = self._cache.load_architecture(arch_id)
+            arch = self._build(arch_id, cached) if cached is not None else None
+            if arch is None:
+                del self._ids[arch_id]
+                raise KeyError(arch_id)
+            return arch
+
+    def __contains__(self, arch_id: object) -> bool:
+        return arch_id in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._ids))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def prefetch(self, ids: Optional[Iterable[str]] = None) -> None:
+        """
+        Load entries that have not been built yet.
+
+        Args:
+            ids: Only load these IDs (default: every entry)
+        """
+        self._load_missing(ids)
+
+    def items(self) -> Any:
+        self._load_missing()
+        with self._lock:
+            return {i: self._built[i] for i in self._ids}.items()
+
+    def values(self) -> Any:
+        self._load_missing()
+        with self._lock:
+            return [self._built[i] for i in self._ids]
+
+    def _build(self, arch_id: str, cached: dict) -> Optional[Architecture]:
+        """Build and remember one architecture, logging failures."""
+        try:
+            arch = arch_from_cached(arch_id, cached)
+        except Exception as e:
+            get_cli_logger().warning(
+                "architecture_load_error",
+                arch_id=arch_id,
+                error=str(e),
+            )
+            return None
+        self._built[arch_id] = arch
+        return arch
+
+    def _load_missing(self, ids: Optional[Iterable[str]] = None) -> None:
+        """Load not-yet-built architectures with one bulk cache read."""
+        # Materialized before locking: ``ids`` may be this mapping itself
+        wanted = None if ids is None else list(ids)
+        with self._lock:
+            missing = [
+                i
+                for i in (list(self._ids) if wanted is None else wanted)
+                if i in self._ids and i not in self._built
+            ]
+            if not missing:
+                return
+            for arch_id, cached in self._cache.load_all(missing):
+                self._build(arch_id, cached)
+            for arch_id in missing:
+                if arch_id not in self._built:
+                    del self._ids[arch_id]
+
+
+def event_runner() -> asyncio.Runner:
+    """
+    Create an ``asyncio.Runner`` for running several coroutines on one loop.
+
+    Uses uvloop's event loop when it is installed, otherwise the default
+    asyncio loop. The caller is responsible for closing the runner.
+
+    Returns:
+        A new asyncio.Runner
+    """
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    return asyncio.Runner(loop_factory=loop_factory)
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a fresh event loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    with event_runner() as runner:
+        return runner.run(coro)
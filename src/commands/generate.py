@@ -0,0 +1,142 @@
+"""Generate command - synthesize sample applications."""
+
+from __future__ import annotations
+
+import click
+
+from src.commands.common import (
+    Context,
+    arch_from_cached,
+    output_json,
+    pass_context,
+    run_async,
+)
+from src.generator import DEFAULT_MAX_CONCURRENCY, generate_all
+from src.utils.cache import ArchitectureCache
+
+_DRY_RUN = {"status": "dry_run", "message": "Would generate sample applications"}
+
+
+@click.command()
+@click.option(
+    "--architecture",
+    "architectures",
+    multiple=True,
+    help="Generate for specific architecture (can be repeated)",
+)
+@click.option(
+    "--skip-cache",
+    is_flag=True,
+    default=False,
+    help="Force regeneration even if cached",
+)
+@click.option(
+    "--token-budget",
+    type=int,
+    default=500000,
+    help="Maximum Claude API tokens",
+)
+@click.option(
+    "--parallelism",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_CONCURRENCY,
+    help="Concurrent architecture generations",
+)
+@click.option(
+    "--batch-api",
+    is_flag=True,
+    default=False,
+    help="Submit generations as one discounted message batch (slower to return)",
+)
+@click.option(
+    "--validate-only",
+    is_flag=True,
+    default=False,
+    help="Check if generated code compiles, don't save",
+)
+@pass_context
+def generate(
+    ctx: Context,
+    architectures: tuple[str, ...],
+    skip_cache: bool,
+    token_budget: int,
+    parallelism: int,
+    batch_api: bool,
+    validate_only: bool,
+) -> None:
+    """Generate sample applications for architectures."""
+    arch_id_list = list(architectures) if architectures else None
+
+    ctx.logger.info(
+        "generate_started",
+        architectures=arch_id_list or "all",
+        skip_cache=skip_cache,
+        token_budget=token_budget,
+        parallelism=parallelism,
+        batch_api=batch_api,
+    )
+
+    if ctx.dry_run:
+        output_json({
+            **_DRY_RUN,
+            "architectures": arch_id_list or "all",
+            "token_budget": token_budget,
+            "validate_only": validate_only,
+        })
+        return
+
+    ctx.ensure_dirs(ctx.cache_dir)
+
+    try:
+        # Load cached architectures
+        arch_cache = ArchitectureCache(ctx.cache_dir)
+        arch_ids = arch_id_list or arch_cache.list_keys()
+
+        if not arch_ids:
+            output_json({
+                "status": "error",
+                "message": "No architectures found. Run 'mine' first.",
+            })
+            return
+
+        # Load architecture objects, overlapping the per-architecture file reads
+        arch_list = [
+            arch_from_cached(arch_id, cached)
+            for arch_id, cached in arch_cache.load_all(arch_ids)
+        ]
+
+        if not arch_list:
+            output_json({
+                "status": "error",
+                "message": "No valid architectures found in cache.",
+            })
+            return
+
+        # Generate applications
+        result = run_async(
+            generate_all(
+                architectures=arch_list,
+                cache_dir=ctx.cache_dir,
+                skip_cache=skip_cache,
+                validate_only=validate_only,
+                token_budget=token_budget,
+                max_concurrency=parallelism,
+                use_batch_api=batch_api,
+            )
+        )
+
+        output_json({
+            "status": "success" if result.success else "partial",
+            "message": f"Generated {len(result.apps)} applications",
+            **result.to_dict(),
+        })
+
+    except Exception as e:
+        ctx.logger.error("generation_failed", error=str(e))
+        output_json({
+            "status": "error",
+            "message": f"Generation failed: {e}",
+        })
+
+
+cmd = generate
@@ -0,0 +1,95 @@
+"""Mine command - discover templates from configured sources."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import click
+
+from src.commands.common import Context, output_json, pass_context, run_async
+from src.miner import list_sources, mine_all
+
+_DRY_RUN = {"status": "dry_run", "message": "Would mine templates from sources"}
+
+
+@click.command()
+@click.option(
+    "--source",
+    "sources",
+    multiple=True,
+    help="Mine only this source (can be repeated)",
+)
+@click.option(
+    "--skip-cache",
+    is_flag=True,
+    default=False,
+    help="Force re-mining even if cache is valid",
+)
+@click.option(
+    "--include-diagrams/--no-diagrams",
+    default=True,
+    help="Include diagram sources",
+)
+@click.option(
+    "--max-per-source",
+    type=int,
+    default=None,
+    help="Maximum templates per source",
+)
+@pass_context
+def mine(
+    ctx: Context,
+    sources: tuple[str, ...],
+    skip_cache: bool,
+    include_diagrams: bool,
+    max_per_source: Optional[int],
+) -> None:
+    """Mine templates from configured sources."""
+    source_list = list(sources) if sources else None
+
+    ctx.logger.info(
+        "mine_started",
+        sources=source_list or "all",
+        skip_cache=skip_cache,
+        include_diagrams=include_diagrams,
+    )
+
+    if ctx.dry_run:
+        available_sources = list_sources(include_diagrams=include_diagrams)
+        output_json({
+            **_DRY_RUN,
+            "sources": source_list or available_sources,
+            "include_diagrams": include_diagrams,
+            "max_per_source": max_per_source,
+        })
+        return
+
+    ctx.ensure_dirs(ctx.cache_dir)
+
+    try:
+        # Run mining
+        result = run_async(
+            mine_all(
+                cache_dir=ctx.cache_dir,
+                sources=source_list,
+                include_diagrams=include_diagrams,
+                max_per_source=max_per_source,
+                skip_cache=skip_cache,
+            )
+        )
+
+        output_json({
+            "status": "success" if result.success else "partial",
+            "message": f"Mined {len(result.architectures)} architectures",
+            **result.to_dict(),
+        })
+
+    except Exception as e:
+        ctx.logger.error("mining_failed", error=str(e))
+        output_json({
+            "status": "error",
+            "message": f"Mining failed: {e}",
+        })
+
+
+cmd = mine
@@ -0,0 +1,161 @@
+"""Report command - build the results dashboard."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import click
+
+from src.commands.common import (
+    TEMPLATES_DIR,
+    Context,
+    LazyArchMap,
+    get_reporter,
+    output_json,
+    pass_context,
+    run_async,
+)
+from src.models import ValidationRun
+from src.utils.cache import AppCache, ArchitectureCache
+from src.utils.jsonio import loads
+
+_DRY_RUN = {"status": "dry_run", "message": "Would generate report"}
+
+
+@click.command()
+@click.option(
+    "--run-id",
+    default=None,
+    help="Generate report for specific run (default: latest)",
+)
+@click.option(
+    "--create-issues",
+    is_flag=True,
+    default=False,
+    help="Create GitHub issues for failures",
+)
+@click.option(
+    "--github-token",
+    envvar="GITHUB_TOKEN",
+    default=None,
+    help="GitHub API token (or set GITHUB_TOKEN env var)",
+)
+@click.option(
+    "--github-repo",
+    envvar="GITHUB_REPOSITORY",
+    default=None,
+    help="GitHub repository (owner/repo) (or set GITHUB_REPOSITORY env var)",
+)
+@click.option(
+    "--dashboard-url",
+    default="",
+    help="Base URL for dashboard links in issues",
+)
+@click.option(
+    "--skip-deploy",
+    is_flag=True,
+    default=False,
+    help="Generate but don't deploy to gh-pages",
+)
+@pass_context
+def report(
+    ctx: Context,
+    run_id: Optional[str],
+    create_issues: bool,
+    github_token: Optional[str],
+    github_repo: Optional[str],
+    dashboard_url: str,
+    skip_deploy: bool,
+) -> None:
+    """Generate dashboard report."""
+    ctx.logger.info(
+        "report_started",
+        run_id=run_id or "latest",
+        create_issues=create_issues,
+    )
+
+    if ctx.dry_run:
+        output_json({
+            **_DRY_RUN,
+            "run_id": run_id or "latest",
+            "create_issues": create_issues,
+        })
+        return
+
+    ctx.ensure_dirs(ctx.output_dir)
+    reporter = get_reporter()
+
+    # Load architectures from cache for enriched dashboard data
+    arch_cache = ArchitectureCache(ctx.cache_dir)
+    app_cache = AppCache(ctx.cache_dir)
+    architectures = LazyArchMap(arch_cache, arch_cache.list_keys())
+
+    # Generate the dashboard
+    generator = reporter.get_site_generator(
+        templates_dir=TEMPLATES_DIR,
+        output_dir=ctx.output_dir,
+        base_url="",
+    )
+
+    try:
+        data_dir = ctx.output_dir / "data"
+        index_path = generator.generate(
+            data_dir=data_dir,
+            architectures=architectures if architectures else None,
+            app_cache=app_cache,
+        )
+        ctx.logger.info("report_generated", output_path=str(index_path))
+
+        issue_stats = {"created": 0, "closed": 0, "skipped": 0}
+
+        # Process issues if requested
+        if create_issues:
+            # Load latest run results
+            try:
+                raw = (data_dir / "latest.json").read_bytes()
+            except FileNotFoundError:
+                ctx.logger.warning("no_latest_run_for_issues")
+            else:
+                run = ValidationRun.from_dict(loads(raw))
+
+                # Get results as ArchitectureResult objects
+                results = run.architecture_results
+
+                if results:
+                    issue_stats = run_async(
+                        reporter.process_results_for_issues(
+                            results=results,
+                            data_dir=data_dir,
+                            github_token=github_token,
+                            github_repo=github_repo,
+                            dashboard_url=dashboard_url,
+                            dry_run=ctx.dry_run,
+                        )
+                    )
+                    ctx.logger.info(
+                        "issues_processed",
+                        created=issue_stats["created"],
+                        closed=issue_stats["closed"],
+                    )
+
+        output_json({
+            "status": "success",
+            "message": "Dashboard generated successfully",
+            "output_path": str(index_path),
+            "run_id": run_id or "latest",
+            "issues": issue_stats if create_issues else None,
+        })
+
+        # TODO: Implement gh-pages deployment in Phase 8 (US6)
+        if not skip_deploy:
+            ctx.logger.info("deployment_skipped", reason="not_implemented")
+
+    except Exception as e:
+        ctx.logger.error("report_generation_failed", error=str(e))
+        output_json({
+            "status": "error",
+            "message": f"Failed to generate report: {e}",
+        })
+
+
+cmd = report
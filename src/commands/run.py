@@ -0,0 +1,559 @@
+"""Run command - execute the full validation pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import sys
+import traceback
+from time import perf_counter
+from typing import Any, Optional
+
+import click
+
+from src.commands.common import (
+    PACKAGE_TEMPLATES_DIR,
+    TEMPLATES_DIR,
+    Context,
+    LazyArchMap,
+    event_runner,
+    get_cli_logger,
+    get_reporter,
+    output_json,
+    pass_context,
+    run_async,
+)
+from src.generator import architecture_cache_key, generate_all, probe_cache_key
+from src.miner import mine_all
+from src.models import PipelineStatus, ProbeType, StageTiming
+from src.pipeline import run_guards
+from src.pipeline.guards import guard_error_to_status
+from src.processor import ArchitectureProcessor, ProcessorConfig
+from src.runner import RunResult, run_validations
+from src.utils.cache import AppCache, ArchitectureCache
+
+_DRY_RUN = {"status": "dry_run", "message": "Would run full pipeline"}
+
+# Registry stats reported in the FSM run output, with their defaults
+_REGISTRY_OUTPUT_FIELDS = (
+    ("total_architectures", 0),
+    ("tested_architectures", 0),
+    ("new_this_week", 0),
+    ("services_coverage", {}),
+)
+
+# Minimal index.html written when dashboard generation fails
+_FALLBACK_HTML = """<!DOCTYPE html>
+<html><head><title>Dashboard Error</title>
+<style>body{font-family:system-ui;background:#0f172a;color:#e2e8f0;padding:2rem;text-align:center;}
+h1{color:#f87171;}pre{background:#1e293b;padding:1rem;border-radius:0.5rem;text-align:left;overflow:auto;}</style></head>
+<body><h1>Dashboard Generation Failed</h1><pre>%s</pre></body></html>"""
+
+
+async def _validate_with_prefetch(
+    architectures: LazyArchMap,
+    **validation_kwargs: Any,
+) -> RunResult:
+    """
+    Run validations while loading the dashboard's architectures.
+
+    Validation is dominated by LocalStack and subprocess waits, so the
+    cache reads for the reporting stage are done in a worker thread
+    alongside it.
+
+    Args:
+        architectures: Dashboard architecture map to prefetch
+        **validation_kwargs: Arguments for run_validations
+
+    Returns:
+        The validation result
+    """
+    validation_result, _ = await asyncio.gather(
+        run_validations(**validation_kwargs),
+        asyncio.to_thread(_prefetch_quietly, architectures),
+    )
+    return validation_result
+
+
+def _prefetch_quietly(architectures: LazyArchMap) -> None:
+    """
+    Prefetch architectures, logging instead of raising on failure.
+
+    A failed prefetch only costs the reporting stage its head start (it
+    loads entries on demand), so it must not discard the validation result.
+
+    Args:
+        architectures: Architecture map to prefetch
+    """
+    try:
+        architectures.prefetch()
+    except Exception as e:
+        get_cli_logger().warning("architecture_prefetch_failed", error=str(e))
+
+
+def _run_with_fsm(
+    ctx: Context,
+    skip_mining: bool,
+    skip_generation: bool,
+    skip_cache: bool,
+    create_issues: bool,
+    github_token: Optional[str],
+    github_repo: Optional[str],
+    dashboard_url: str,
+    localstack_version: str,
+    max_per_source: int,
+    incremental: bool = False,
+) -> None:
+    """Run pipeline using FSM-based processor."""
+    ctx.logger.info(
+        "fsm_pipeline_started",
+        skip_cache=skip_cache,
+        incremental=incremental,
+    )
+
+    ctx.pipeline_status = PipelineStatus.RUNNING
+
+    # Run guards - fail fast on critical preconditions
+    if ctx.pipeline_config:
+        guard_result = run_guards(
+            config=ctx.pipeline_config,
+            require_generation=not skip_generation,
+            require_docker=True,
+            require_templates=True,
+        )
+
+        if guard_result.is_err():
+            error = guard_result.unwrap_err()
+            ctx.pipeline_status = guard_error_to_status(error)
+            ctx.logger.error(
+                "guard_failed",
+                code=error.code,
+                message=error.message,
+                details=error.details,
+            )
+            output_json({
+                "status": "error",
+                "pipeline_status": ctx.pipeline_status.value,
+                "message": str(error),
+                "exit_code": error.code,
+            })
+            sys.exit(error.code)
+
+    try:
+        # Configure processor
+        config = ProcessorConfig(
+            cache_dir=ctx.cache_dir,
+            max_per_source=max_per_source,
+            include_diagrams=True,
+            skip_mining=skip_mining,
+            skip_generation=skip_generation,
+            skip_cache=skip_cache,
+            localstack_version=localstack_version,
+            incremental=incremental,
+        )
+
+        # Run processor
+        processor = ArchitectureProcessor(config)
+        validation_run = run_async(processor.run())
+
+        ctx.logger.info(
+            "fsm_pipeline_completed",
+            stats=processor.machine.stats.to_dict(),
+            summary=processor.machine.progress_summary(),
+        )
+
+        # Generate report
+        templates_dir = TEMPLATES_DIR
+
+        ctx.logger.info(
+            "templates_path_check",
+            primary=str(PACKAGE_TEMPLATES_DIR),
+            primary_exists=templates_dir is PACKAGE_TEMPLATES_DIR,
+            using=str(templates_dir),
+        )
+
+        # Ensure output data directory exists early
+        ctx.ensure_dirs(ctx.output_dir / "data")
+
+        # Load architectures for dashboard - from processor first, then cache
+        arch_cache = ArchitectureCache(ctx.cache_dir)
+
+        # First, get architectures from the processor (includes newly discovered)
+        ctx.logger.info(
+            "architectures_from_processor",
+            count=len(processor._architectures),
+            ids=list(processor._architectures)[:10],
+        )
+
+        # Then supplement with cached architectures the processor does not
+        # hold; these are only loaded when the dashboard reads them
+        cached_ids = arch_cache.list_keys()
+        architectures = LazyArchMap(arch_cache, cached_ids, built=processor._architectures)
+
+        ctx.logger.info(
+            "total_architectures_for_dashboard",
+            count=len(architectures),
+        )
+
+        app_cache = AppCache(ctx.cache_dir)
+
+        try:
+            ctx.logger.info(
+                "dashboard_generation_starting",
+                templates_dir=str(templates_dir),
+                templates_exists=templates_dir.exists(),
+                output_dir=str(ctx.output_dir),
+                arch_count=len(architectures) if architectures else 0,
+            )
+
+            generator = get_reporter().get_site_generator(
+                templates_dir=templates_dir,
+                output_dir=ctx.output_dir,
+                base_url="",
+            )
+
+            generator.generate(
+                run=validation_run,
+                data_dir=ctx.output_dir / "data",
+                architectures=architectures if architectures else None,
+                app_cache=app_cache,
+            )
+            ctx.logger.info("dashboard_generation_completed")
+        except Exception as e:
+            ctx.logger.error("dashboard_generation_failed", error=str(e), tb=traceback.format_exc())
+            # Create minimal fallback index.html
+            index_path = ctx.output_dir / "index.html"
+            index_path.write_text(_FALLBACK_HTML % html.escape(str(e)))
+
+        # Save registry data for dashboard (cumulative tracking)
+        registry_data_file = ctx.output_dir / "data" / "registry.json"
+        registry_stats = processor.write_registry_to(registry_data_file, days=30)
+        ctx.logger.info("registry_data_saved", path=str(registry_data_file))
+
+        results_count = len(validation_run.results) if validation_run.results else 0
+
+        # Also save discovered architectures count for debugging
+        ctx.logger.info(
+            "architectures_discovered",
+            count=len(architectures),
+            from_cache=len(cached_ids),
+            from_processor=len(processor._architectures),
+            results=results_count,
+        )
+
+        # Output results
+        stats = processor.machine.stats
+
+        output_json({
+            "status": "success" if stats.errors == 0 else "partial",
+            "run_id": validation_run.id,
+            "statistics": stats.to_summary_dict(),
+            "timing": stats.to_timing_dict(),
+            "fsm_summary": processor.machine.progress_summary(),
+            "registry": {
+                key: registry_stats.get(key, default)
+                for key, default in _REGISTRY_OUTPUT_FIELDS
+            },
+            "architectures_discovered": len(processor._architectures),
+            "architecture_ids": list(processor._architectures),
+            "results_count": results_count,
+        })
+
+    except Exception as e:
+        ctx.logger.error("fsm_pipeline_failed", error=str(e), traceback=traceback.format_exc())
+        output_json({
+            "status": "error",
+            "message": str(e),
+        })
+        raise
+
+
+@click.command()
+@click.option(
+    "--skip-mining",
+    is_flag=True,
+    default=False,
+    help="Use cached architectures only",
+)
+@click.option(
+    "--skip-generation",
+    is_flag=True,
+    default=False,
+    help="Use cached sample apps only",
+)
+@click.option(
+    "--create-issues",
+    is_flag=True,
+    default=False,
+    help="Create GitHub issues for failures",
+)
+@click.option(
+    "--github-token",
+    envvar="GITHUB_TOKEN",
+    default=None,
+    help="GitHub API token (or set GITHUB_TOKEN env var)",
+)
+@click.option(
+    "--github-repo",
+    envvar="GITHUB_REPOSITORY",
+    default=None,
+    help="GitHub repository (owner/repo) (or set GITHUB_REPOSITORY env var)",
+)
+@click.option(
+    "--dashboard-url",
+    default="",
+    help="Base URL for dashboard links in issues",
+)
+@click.option(
+    "--parallelism",
+    type=int,
+    default=4,
+    help="Concurrent validations",
+)
+@click.option(
+    "--localstack-version",
+    default="latest",
+    help="LocalStack image tag",
+)
+@click.option(
+    "--max-per-source",
+    type=int,
+    default=3,
+    help="Maximum architectures per source (default: 3, keeps API calls low)",
+)
+@click.option(
+    "--use-fsm",
+    is_flag=True,
+    default=False,
+    help="Use FSM-based processor (sequential, handles rate limits gracefully)",
+)
+@click.option(
+    "--force-fresh",
+    is_flag=True,
+    default=False,
+    help="Force fresh mining and generation (ignore cache)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Incremental mode: only discover and test NEW architectures (skip already-known)",
+)
+@pass_context
+def run(
+    ctx: Context,
+    skip_mining: bool,
+    skip_generation: bool,
+    create_issues: bool,
+    github_token: Optional[str],
+    github_repo: Optional[str],
+    dashboard_url: str,
+    parallelism: int,
+    localstack_version: str,
+    max_per_source: int,
+    use_fsm: bool,
+    force_fresh: bool,
+    incremental: bool,
+) -> None:
+    """Run full pipeline (mine -> generate -> validate -> report)."""
+    ctx.logger.info(
+        "run_started",
+        skip_mining=skip_mining,
+        skip_generation=skip_generation,
+        parallelism=parallelism,
+        use_fsm=use_fsm,
+    )
+
+    if ctx.dry_run:
+        output_json({
+            **_DRY_RUN,
+            "stages": {
+                "mine": not skip_mining,
+                "generate": not skip_generation,
+                "validate": True,
+                "report": True,
+            },
+            "use_fsm": use_fsm,
+        })
+        return
+
+    ctx.ensure_dirs()
+
+    # Use FSM-based processor if requested
+    if use_fsm:
+        _run_with_fsm(
+            ctx=ctx,
+            skip_mining=skip_mining,
+            skip_generation=skip_generation,
+            skip_cache=force_fresh,
+            create_issues=create_issues,
+            github_token=github_token,
+            github_repo=github_repo,
+            dashboard_url=dashboard_url,
+            localstack_version=localstack_version,
+            max_per_source=max_per_source,
+            incremental=incremental,
+        )
+        return
+
+    pipeline_start = perf_counter()
+    timing = StageTiming()
+    errors = []
+    # One event loop shared by mining, generation and validation
+    runner = event_runner()
+
+    try:
+        # Stage 1: Mining
+        if not skip_mining:
+            ctx.logger.info("pipeline_stage", stage="mining")
+            mining_start = perf_counter()
+
+            mining_result = runner.run(
+                mine_all(
+                    cache_dir=ctx.cache_dir,
+                    include_diagrams=True,
+                    max_per_source=max_per_source,
+                )
+            )
+
+            timing.mining_seconds = perf_counter() - mining_start
+
+            if not mining_result.success:
+                errors.extend(mining_result.errors)
+
+        # One view of the cached architectures shared by every later stage:
+        # generation loads what it needs, and reporting reuses those instances
+        arch_cache = ArchitectureCache(ctx.cache_dir)
+        app_cache = AppCache(ctx.cache_dir)
+        architectures = LazyArchMap(arch_cache, arch_cache.list_keys())
+
+        # Stage 2: Generation
+        if not skip_generation:
+            ctx.logger.info("pipeline_stage", stage="generation")
+            gen_start = perf_counter()
+
+            # Key apps as the synthesizer does. A recorded content hash is
+            # the default key, so only architectures without one are loaded
+            def app_key(arch_id: str, metadata: dict) -> Optional[str]:
+                base_key = metadata.get("content_hash")
+                if not base_key:
+                    arch = architectures.get(arch_id)
+                    if arch is None:
+                        return None
+                    base_key = architecture_cache_key(arch)
+                return probe_cache_key(base_key, ProbeType.API_PARITY)
+
+            # Load only architectures without a cached app
+            pending = list(
+                arch_cache.iter_needs_generation(app_cache, app_key, architectures)
+            )
+            architectures.prefetch(pending)
+            arch_list = [
+                arch for arch_id in pending
+                if (arch := architectures.get(arch_id)) is not None
+            ]
+
+            if arch_list:
+                gen_result = runner.run(
+                    generate_all(
+                        architectures=arch_list,
+                        cache_dir=ctx.cache_dir,
+                    )
+                )
+                if not gen_result.success:
+                    errors.extend(gen_result.errors)
+
+            timing.generation_seconds = perf_counter() - gen_start
+
+        # Stage 3: Validation
+        ctx.logger.info("pipeline_stage", stage="validation")
+        validation_start = perf_counter()
+
+        # Anything generation did not load is prefetched while validation runs
+        validation_result = runner.run(
+            _validate_with_prefetch(
+                architectures,
+                cache_dir=ctx.cache_dir,
+                output_dir=ctx.output_dir,
+                parallelism=parallelism,
+                localstack_version=localstack_version,
+            )
+        )
+
+        timing.running_seconds = perf_counter() - validation_start
+
+        if not validation_result.success:
+            errors.extend(validation_result.errors)
+
+        # Stage 4: Reporting
+        ctx.logger.info("pipeline_stage", stage="reporting")
+        reporting_start = perf_counter()
+
+        generator = get_reporter().get_site_generator(
+            templates_dir=TEMPLATES_DIR,
+            output_dir=ctx.output_dir,
+            base_url="",
+        )
+
+        generator.generate(
+            run=validation_result.run,
+            data_dir=ctx.output_dir / "data",
+            architectures=architectures if architectures else None,
+            app_cache=app_cache,
+        )
+
+        timing.reporting_seconds = perf_counter() - reporting_start
+        timing.total_seconds = perf_counter() - pipeline_start
+
+        # Stage 5: Issue Creation (optional)
+        issue_stats = {"created": 0, "closed": 0, "skipped": 0}
+
+        if create_issues and validation_result.run:
+            ctx.logger.info("pipeline_stage", stage="issues")
+
+            # Get results as ArchitectureResult objects
+            results = validation_result.run.architecture_results
+
+            if results:
+                issue_stats = runner.run(
+                    get_reporter().process_results_for_issues(
+                        results=results,
+                        data_dir=ctx.output_dir / "data",
+                        github_token=github_token,
+                        github_repo=github_repo,
+                        dashboard_url=dashboard_url,
+                        dry_run=ctx.dry_run,
+                    )
+                )
+                ctx.logger.info(
+                    "issues_processed",
+                    created=issue_stats["created"],
+                    closed=issue_stats["closed"],
+                )
+
+        # Output results
+        output_json({
+            "status": "success" if not errors else "partial",
+            "message": "Pipeline completed",
+            "run_id": validation_result.run.id if validation_result.run else None,
+            "timing": timing.to_dict(),
+            "statistics": validation_result.run.statistics.to_dict()
+                if validation_result.run and validation_result.run.statistics
+                else {},
+            "issues": issue_stats if create_issues else None,
+            "errors": errors,
+        })
+
+    except Exception as e:
+        ctx.logger.error("pipeline_failed", error=str(e))
+        output_json({
+            "status": "error",
+            "message": f"Pipeline failed: {e}",
+            "errors": errors + [str(e)],
+        })
+
+    finally:
+        runner.close()
+
+
+cmd = run
@@ -0,0 +1,135 @@
+"""Status command - show cache and latest run state."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+import click
+
+from src.commands.common import Context, output_json, pass_context
+from src.utils.cache import scan_cache
+from src.utils.jsonio import loads
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+_FORMAT_CHOICE = click.Choice(["table", "json"], case_sensitive=False)
+
+if msgspec is not None:
+
+    class RunSummary(msgspec.Struct):
+        """Subset of a run file needed by ``status``; other keys are skipped."""
+
+        id: str
+        status: str = "unknown"
+        statistics: dict = {}
+
+
+def _latest_run_file(runs_dir: Path) -> Optional[Path]:
+    """
+    Find the newest run-*.json file in a single directory scan.
+
+    Run ids embed their timestamp, so the greatest name is the newest.
+
+    Args:
+        runs_dir: Directory containing run files
+
+    Returns:
+        Path of the newest run file, or None if there are none
+    """
+    try:
+        with os.scandir(runs_dir) as entries:
+            latest = max(
+                (
+                    e.name
+                    for e in entries
+                    if e.name.startswith("run-") and e.name.endswith(".json")
+                ),
+                default=None,
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return runs_dir / latest if latest else None
+
+
+def _read_run_summary(path: Path) -> dict[str, Any]:
+    """
+    Read only the id, status and statistics of a run file.
+
+    Args:
+        path: Path to a run-*.json file
+
+    Returns:
+        Dictionary with id, status and statistics keys
+    """
+    data = path.read_bytes()
+    if msgspec is not None:
+        return msgspec.structs.asdict(msgspec.json.decode(data, type=RunSummary))
+
+    run = loads(data)
+    return {
+        "id": run["id"],
+        "status": run.get("status", "unknown"),
+        "statistics": run.get("statistics", {}),
+    }
+
+
+@click.command()
+@click.option(
+    "--format",
+    "output_format",
+    type=_FORMAT_CHOICE,
+    default="table",
+    help="Output format",
+)
+@pass_context
+def status(ctx: Context, output_format: str) -> None:
+    """Show current state."""
+    # Count cached items and their size in a single walk
+    arch_count, app_count, cache_size = scan_cache(ctx.cache_dir)
+
+    # Check for latest run
+    latest_run = None
+    latest_file = _latest_run_file(ctx.output_dir / "data" / "runs")
+    if latest_file:
+        latest_run = _read_run_summary(latest_file)
+
+    status_data = {
+        "cached_architectures": arch_count,
+        "cached_apps": app_count,
+        "latest_run": (
+            {
+                "id": latest_run["id"],
+                "status": latest_run.get("status", "unknown"),
+                "pass_rate": latest_run.get("statistics", {}).get("pass_rate", 0),
+            }
+            if latest_run
+            else None
+        ),
+        "cache_size_mb": round(cache_size / (1024 * 1024), 2),
+    }
+
+    if output_format == "json":
+        output_json(status_data)
+    else:
+        lines = [
+            "LocalStack Architecture Validator Status",
+            "=" * 40,
+            f"Cached architectures: {arch_count}",
+            f"Cached apps: {app_count}",
+            f"Cache size: {status_data['cache_size_mb']} MB",
+        ]
+        if latest_run:
+            lines.append(f"\nLatest run: {latest_run['id']}")
+            lines.append(f"  Status: {latest_run.get('status', 'unknown')}")
+            stats = latest_run.get("statistics", {})
+            if stats:
+                lines.append(f"  Pass rate: {stats.get('pass_rate', 0):.1%}")
+        click.echo("\n".join(lines))
+
+
+cmd = status
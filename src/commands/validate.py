@@ -0,0 +1,117 @@
+"""Validate command - run sample apps against LocalStack."""
+
+from __future__ import annotations
+
+import click
+
+from src.commands.common import Context, output_json, pass_context, run_async
+from src.runner import run_validations
+
+_DRY_RUN = {"status": "dry_run", "message": "Would run validations"}
+
+
+@click.command()
+@click.option(
+    "--architecture",
+    "architectures",
+    multiple=True,
+    help="Validate specific architecture (can be repeated)",
+)
+@click.option(
+    "--exclude",
+    "excludes",
+    multiple=True,
+    help="Exclude architectures matching pattern",
+)
+@click.option(
+    "--parallelism",
+    type=int,
+    default=4,
+    help="Concurrent validations",
+)
+@click.option(
+    "--localstack-version",
+    default="latest",
+    help="LocalStack image tag",
+)
+@click.option(
+    "--timeout",
+    type=int,
+    default=600,
+    help="Per-architecture timeout in seconds",
+)
+@click.option(
+    "--skip-cleanup",
+    is_flag=True,
+    default=False,
+    help="Don't remove containers after validation",
+)
+@pass_context
+def validate(
+    ctx: Context,
+    architectures: tuple[str, ...],
+    excludes: tuple[str, ...],
+    parallelism: int,
+    localstack_version: str,
+    timeout: int,
+    skip_cleanup: bool,
+) -> None:
+    """Run validation pipeline."""
+    arch_id_list = list(architectures) if architectures else None
+
+    ctx.logger.info(
+        "validate_started",
+        architectures=arch_id_list or "all",
+        parallelism=parallelism,
+        localstack_version=localstack_version,
+        timeout=timeout,
+    )
+
+    if ctx.dry_run:
+        output_json({
+            **_DRY_RUN,
+            "architectures": arch_id_list or "all",
+            "parallelism": parallelism,
+            "localstack_version": localstack_version,
+        })
+        return
+
+    ctx.ensure_dirs()
+
+    try:
+        result = run_async(
+            run_validations(
+                cache_dir=ctx.cache_dir,
+                output_dir=ctx.output_dir,
+                architectures=arch_id_list,
+                excludes=list(excludes) if excludes else None,
+                parallelism=parallelism,
+                localstack_version=localstack_version,
+                timeout=timeout,
+                skip_cleanup=skip_cleanup,
+            )
+        )
+
+        if result.success:
+            output_json({
+                "status": "success",
+                "message": f"Validation completed: {result.run.id}",
+                **result.to_dict(),
+            })
+        else:
+            output_json({
+                "status": "error",
+                "message": "Validation failed",
+                "errors": result.errors,
+                **result.to_dict(),
+            })
+
+    except Exception as e:
+        ctx.logger.error("validation_failed", error=str(e))
+        output_json({
+            "status": "error",
+            "message": f"Validation failed: {e}",
+        })
+
+
+cmd = validate
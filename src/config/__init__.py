@@ -1,5 +1,5 @@
 """Configuration module for ls-arch-validator."""
 
-from src.config.settings import PipelineConfig, load_config
+from src.config.settings import PipelineConfig, load_config, reload_config
 
-__all__ = ["PipelineConfig", "load_config"]
+__all__ = ["PipelineConfig", "load_config", "reload_config"]
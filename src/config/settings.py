@@ -6,19 +6,45 @@ Configuration can be loaded from YAML files and validated at startup.
 
 from __future__ import annotations
 
+import functools
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TypeVar, get_type_hints
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from src.utils.result import ConfigError, Err, Ok, Result
 
+D = TypeVar("D")
+
+
+class _ConfigLoadError(Exception):
+    """Carries a ConfigError out of the unwrapped loading helpers."""
+
+    def __init__(self, error: ConfigError) -> None:
+        super().__init__(str(error))
+        self.error = error
 
 # Cache version - increment when cache format changes
 CACHE_VERSION = "2.0"
 
+# Field metadata for values set at runtime rather than read from YAML
+_RUNTIME = {"runtime": True}
+
+# YAML keys for sub-configuration sections whose key differs from the field
+# name; an empty tuple means the section's keys sit at the top level
+_SECTION_KEYS: dict[str, tuple[str, ...]] = {
+    "retry": ("retries", "retry"),
+    "container": ("container_limits",),
+    "storage": (),
+}
+
 
 @dataclass
 class TimeoutConfig:
@@ -121,10 +147,10 @@ class PipelineConfig:
     logging: LoggingConfig = field(default_factory=LoggingConfig)
 
     # Paths (set at runtime)
-    config_dir: Optional[Path] = None
-    cache_dir: Optional[Path] = None
-    output_dir: Optional[Path] = None
-    templates_dir: Optional[Path] = None
+    config_dir: Optional[Path] = field(default=None, metadata=_RUNTIME)
+    cache_dir: Optional[Path] = field(default=None, metadata=_RUNTIME)
+    output_dir: Optional[Path] = field(default=None, metadata=_RUNTIME)
+    templates_dir: Optional[Path] = field(default=None, metadata=_RUNTIME)
 
     # Behavior flags
     require_api_key_for_generation: bool = True
@@ -141,29 +167,10 @@ class PipelineConfig:
         Returns:
             Result with loaded config or error
         """
-        path = Path(path)
-
-        if not path.exists():
-            return Err(ConfigError(
-                field="path",
-                message=f"Configuration file not found: {path}",
-            ))
-
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
-            return Err(ConfigError(
-                field="yaml",
-                message=f"Failed to parse YAML: {e}",
-            ))
-        except Exception as e:
-            return Err(ConfigError(
-                field="file",
-                message=f"Failed to read config file: {e}",
-            ))
-
-        return cls.from_dict(data)
+            return Ok(cls._from_yaml_raw(Path(path)))
+        except _ConfigLoadError as e:
+            return Err(e.error)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Result["PipelineConfig", ConfigError]:
@@ -177,79 +184,41 @@ class PipelineConfig:
             Result with loaded config or error
         """
         try:
-            # Parse sub-configurations
-            timeouts_data = data.get("timeouts", {})
-            timeouts = TimeoutConfig(
-                localstack_start=timeouts_data.get("localstack_start", 120),
-                terraform_init=timeouts_data.get("terraform_init", 60),
-                terraform_apply=timeouts_data.get("terraform_apply", 300),
-                terraform_destroy=timeouts_data.get("terraform_destroy", 120),
-                test_execution=timeouts_data.get("test_execution", 180),
-                per_architecture=timeouts_data.get("per_architecture", 600),
-                diagram_scrape=timeouts_data.get("diagram_scrape", 60),
-                diagram_parse=timeouts_data.get("diagram_parse", 30),
-                git_clone=timeouts_data.get("git_clone", 120),
-                template_conversion=timeouts_data.get("template_conversion", 60),
-                generation_request=timeouts_data.get("generation_request", 120),
-                vision_request=timeouts_data.get("vision_request", 60),
-            )
-
-            retry_data = data.get("retries", data.get("retry", {}))
-            retry = RetryConfig(
-                max_attempts=retry_data.get("max_attempts", 3),
-                backoff_factor=float(retry_data.get("backoff_factor", 2.0)),
-                max_backoff=float(retry_data.get("max_backoff", 60.0)),
-                rate_limit_base_delay=float(retry_data.get("rate_limit_base_delay", 35.0)),
-            )
+            return Ok(cls._from_dict_raw(data))
+        except _ConfigLoadError as e:
+            return Err(e.error)
 
-            container_data = data.get("container_limits", {})
-            container = ContainerConfig(
-                mem_limit=container_data.get("mem_limit", "2g"),
-                memswap_limit=container_data.get("memswap_limit", "2g"),
-                cpu_period=container_data.get("cpu_period", 100000),
-                cpu_quota=container_data.get("cpu_quota", 100000),
-                pids_limit=container_data.get("pids_limit", 256),
-            )
-
-            localstack_data = data.get("localstack", {})
-            localstack = LocalStackConfig(
-                image=localstack_data.get("image", "localstack/localstack:latest"),
-                base_port=localstack_data.get("base_port", 4566),
-                endpoint_template=localstack_data.get("endpoint_template", "http://{host}:{port}"),
-                services=localstack_data.get("services", "lambda,s3,dynamodb,sqs,sns,apigateway,events,stepfunctions"),
-                debug=localstack_data.get("debug", False),
-                lambda_executor=localstack_data.get("lambda_executor", "docker"),
-            )
-
-            storage = StorageConfig(
-                retention_days=data.get("retention_days", 90),
-                max_storage_gb=float(data.get("max_storage_gb", 10.0)),
-                cache_version=data.get("cache_version", CACHE_VERSION),
-            )
-
-            logging_data = data.get("logging", {})
-            logging_config = LoggingConfig(
-                level=logging_data.get("level", "info"),
-                format=logging_data.get("format", "json"),
-            )
-
-            config = cls(
-                parallelism=data.get("parallelism", 4),
-                token_budget=data.get("token_budget", 500000),
-                timeouts=timeouts,
-                retry=retry,
-                container=container,
-                localstack=localstack,
-                storage=storage,
-                logging=logging_config,
-                require_api_key_for_generation=data.get("require_api_key_for_generation", True),
-                fail_on_empty_results=data.get("fail_on_empty_results", True),
-            )
+    @classmethod
+    def _from_yaml_raw(cls, path: Path) -> "PipelineConfig":
+        """Load from a YAML file, raising _ConfigLoadError on failure."""
+        try:
+            with open(path, "rb") as f:
+                data = yaml.load(f, Loader=_YamlLoader) or {}
+        except FileNotFoundError:
+            raise _ConfigLoadError(ConfigError(
+                field="path",
+                message=f"Configuration file not found: {path}",
+            ))
+        except yaml.YAMLError as e:
+            raise _ConfigLoadError(ConfigError(
+                field="yaml",
+                message=f"Failed to parse YAML: {e}",
+            ))
+        except Exception as e:
+            raise _ConfigLoadError(ConfigError(
+                field="file",
+                message=f"Failed to read config file: {e}",
+            ))
 
-            return Ok(config)
+        return cls._from_dict_raw(data)
 
+    @classmethod
+    def _from_dict_raw(cls, data: dict[str, Any]) -> "PipelineConfig":
+        """Build from a dictionary, raising _ConfigLoadError on failure."""
+        try:
+            return _from_dict(cls, data)
         except Exception as e:
-            return Err(ConfigError(
+            raise _ConfigLoadError(ConfigError(
                 field="unknown",
                 message=f"Failed to parse configuration: {e}",
             ))
@@ -261,24 +230,31 @@ class PipelineConfig:
         Returns:
             Result indicating success or validation error
         """
+        error = self._validation_error()
+        if error is not None:
+            return Err(error)
+        return Ok(None)
+
+    def _validation_error(self) -> Optional[ConfigError]:
+        """Return the first invalid setting, or None if all are valid."""
         # Validate parallelism
         if self.parallelism < 1:
-            return Err(ConfigError(
+            return ConfigError(
                 field="parallelism",
                 message=f"Must be at least 1, got {self.parallelism}",
-            ))
+            )
         if self.parallelism > 16:
-            return Err(ConfigError(
+            return ConfigError(
                 field="parallelism",
                 message=f"Must be at most 16, got {self.parallelism}",
-            ))
+            )
 
         # Validate token budget
         if self.token_budget < 1000:
-            return Err(ConfigError(
+            return ConfigError(
                 field="token_budget",
                 message=f"Must be at least 1000, got {self.token_budget}",
-            ))
+            )
 
         # Validate timeouts are positive
         for name, value in [
@@ -288,36 +264,36 @@ class PipelineConfig:
             ("per_architecture", self.timeouts.per_architecture),
         ]:
             if value < 1:
-                return Err(ConfigError(
+                return ConfigError(
                     field=f"timeouts.{name}",
                     message=f"Must be positive, got {value}",
-                ))
+                )
 
         # Validate retry settings
         if self.retry.max_attempts < 1:
-            return Err(ConfigError(
+            return ConfigError(
                 field="retry.max_attempts",
                 message=f"Must be at least 1, got {self.retry.max_attempts}",
-            ))
+            )
         if self.retry.backoff_factor < 1.0:
-            return Err(ConfigError(
+            return ConfigError(
                 field="retry.backoff_factor",
                 message=f"Must be at least 1.0, got {self.retry.backoff_factor}",
-            ))
+            )
 
         # Validate storage
         if self.storage.retention_days < 1:
-            return Err(ConfigError(
+            return ConfigError(
                 field="storage.retention_days",
                 message=f"Must be at least 1, got {self.storage.retention_days}",
-            ))
+            )
         if self.storage.max_storage_gb < 0.1:
-            return Err(ConfigError(
+            return ConfigError(
                 field="storage.max_storage_gb",
                 message=f"Must be at least 0.1, got {self.storage.max_storage_gb}",
-            ))
+            )
 
-        return Ok(None)
+        return None
 
     def get_localstack_endpoint(self, host: str = "localhost", port: int = None) -> str:
         """
@@ -371,11 +347,65 @@ class PipelineConfig:
         )
 
 
+@functools.cache
+def _field_specs(cls: type) -> tuple[tuple[str, Any], ...]:
+    """Resolved (name, type) pairs of a config dataclass's YAML fields."""
+    hints = get_type_hints(cls)
+    return tuple(
+        (f.name, hints[f.name])
+        for f in fields(cls)
+        if f.init and not f.metadata.get("runtime")
+    )
+
+
+def _from_dict(cls: type[D], data: dict[str, Any], base: Optional[D] = None) -> D:
+    """
+    Build a config dataclass from a dictionary.
+
+    Keys missing from ``data`` keep the dataclass default, or the value on
+    ``base`` when one is given. Nested config dataclasses are built from
+    their YAML section (see ``_SECTION_KEYS``). Float fields accept ints.
+
+    Args:
+        cls: Config dataclass to build
+        data: Values keyed by field name
+        base: Existing instance to overlay ``data`` onto
+
+    Returns:
+        New instance of ``cls``
+
+    Raises:
+        TypeError: If ``data`` or one of its sections is not a mapping
+    """
+    if not isinstance(data, dict):
+        raise TypeError(
+            f"expected a mapping for {cls.__name__}, got {type(data).__name__}"
+        )
+    kwargs: dict[str, Any] = {}
+    for name, type_ in _field_specs(cls):
+        if is_dataclass(type_):
+            keys = _SECTION_KEYS.get(name, (name,))
+            if keys:
+                section = next((data[k] for k in keys if k in data), {})
+            else:
+                section = data
+            nested_base = getattr(base, name) if base is not None else None
+            kwargs[name] = _from_dict(type_, section, nested_base)
+        elif name in data:
+            value = data[name]
+            kwargs[name] = float(value) if type_ is float else value
+        elif base is not None:
+            kwargs[name] = getattr(base, name)
+    return cls(**kwargs)
+
+
 def load_config(config_dir: Path = None) -> Result[PipelineConfig, ConfigError]:
     """
     Load configuration from the standard location.
 
     Loads from config/defaults.yaml, then overlays config/timeouts.yaml if present.
+    Results are cached per resolved directory; call ``reload_config`` to
+    pick up changed files.
 
     Args:
         config_dir: Configuration directory (defaults to ./config)
@@ -386,16 +416,33 @@ def load_config(config_dir: Path = None) -> Result[PipelineConfig, ConfigError]:
     if config_dir is None:
         config_dir = Path("./config")
 
-    config_dir = Path(config_dir)
+    return _load_config_cached(str(Path(config_dir).resolve()))
+
+
+def reload_config() -> None:
+    """Drop cached configurations so the next ``load_config`` re-reads them."""
+    _load_config_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_dir_str: str) -> Result[PipelineConfig, ConfigError]:
+    """
+    Load and validate the configuration in a directory.
+
+    Args:
+        config_dir_str: Resolved configuration directory
+
+    Returns:
+        Result with loaded config or error
+    """
+    config_dir = Path(config_dir_str)
 
     # Load defaults
-    defaults_path = config_dir / "defaults.yaml"
-    if defaults_path.exists():
-        result = PipelineConfig.from_yaml(defaults_path)
-        if result.is_err():
-            return result
-        config = result.unwrap()
-    else:
+    try:
+        config = PipelineConfig._from_yaml_raw(config_dir / "defaults.yaml")
+    except _ConfigLoadError as e:
+        if e.error.field != "path":
+            return Err(e.error)
         # Use defaults if no config file
         config = PipelineConfig()
 
@@ -403,35 +450,17 @@ def load_config(config_dir: Path = None) -> Result[PipelineConfig, ConfigError]:
     timeouts_path = config_dir / "timeouts.yaml"
     if timeouts_path.exists():
         try:
-            with open(timeouts_path) as f:
-                timeouts_data = yaml.safe_load(f) or {}
+            with open(timeouts_path, "rb") as f:
+                timeouts_data = yaml.load(f, Loader=_YamlLoader) or {}
 
-            # Update timeouts from overlay
+            # Update timeouts and retry settings from overlay
             if "timeouts" in timeouts_data:
-                td = timeouts_data["timeouts"]
-                config.timeouts = TimeoutConfig(
-                    localstack_start=td.get("localstack_start", config.timeouts.localstack_start),
-                    terraform_init=td.get("terraform_init", config.timeouts.terraform_init),
-                    terraform_apply=td.get("terraform_apply", config.timeouts.terraform_apply),
-                    terraform_destroy=td.get("terraform_destroy", config.timeouts.terraform_destroy),
-                    test_execution=td.get("test_execution", config.timeouts.test_execution),
-                    per_architecture=td.get("per_architecture", config.timeouts.per_architecture),
-                    diagram_scrape=td.get("diagram_scrape", config.timeouts.diagram_scrape),
-                    diagram_parse=td.get("diagram_parse", config.timeouts.diagram_parse),
-                    git_clone=td.get("git_clone", config.timeouts.git_clone),
-                    template_conversion=td.get("template_conversion", config.timeouts.template_conversion),
-                    generation_request=td.get("generation_request", config.timeouts.generation_request),
-                    vision_request=td.get("vision_request", config.timeouts.vision_request),
+                config.timeouts = _from_dict(
+                    TimeoutConfig, timeouts_data["timeouts"], base=config.timeouts
                 )
-
-            # Update retry settings if present
             if "retries" in timeouts_data:
-                rd = timeouts_data["retries"]
-                config.retry = RetryConfig(
-                    max_attempts=rd.get("max_attempts", config.retry.max_attempts),
-                    backoff_factor=float(rd.get("backoff_factor", config.retry.backoff_factor)),
-                    max_backoff=float(rd.get("max_backoff", config.retry.max_backoff)),
-                    rate_limit_base_delay=config.retry.rate_limit_base_delay,
+                config.retry = _from_dict(
+                    RetryConfig, timeouts_data["retries"], base=config.retry
                 )
 
         except Exception as e:
@@ -441,9 +470,9 @@ def load_config(config_dir: Path = None) -> Result[PipelineConfig, ConfigError]:
             ))
 
     # Validate final config
-    validation_result = config.validate()
-    if validation_result.is_err():
-        return Err(validation_result.unwrap_err())
+    error = config._validation_error()
+    if error is not None:
+        return Err(error)
 
     return Ok(config)
 
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 from src.generator.analyzer import InfrastructureAnalysis, TerraformAnalyzer
 from src.generator.prompts import format_generation_prompt, format_test_prompt
-from src.generator.synthesizer import CodeSynthesizer, SynthesisResult
+from src.generator.synthesizer import (
+    ESTIMATED_TOKENS_PER_PROBE,
+    CodeSynthesizer,
+    SynthesisResult,
+    app_cache_key,
+    architecture_cache_key,
+    probe_cache_key,
+)
 from src.generator.validator import CodeValidator, ValidationResult, validate_all_files
 from src.models import Architecture, SampleApp
 from src.utils.cache import AppCache
@@ -17,15 +25,20 @@ from src.utils.tokens import TokenTracker
 
 logger = get_logger("generator")
 
+# Architectures generated at once. API requests are still spaced by the
+# synthesizer's shared rate-limit delay; concurrency overlaps the waiting
+# on responses, test generation and validation
+DEFAULT_MAX_CONCURRENCY = 4
 
+
+@dataclass(slots=True)
 class GenerationResult:
     """Result of generating sample applications."""
 
-    def __init__(self) -> None:
-        self.apps: list[SampleApp] = []
-        self.errors: list[str] = []
-        self.skipped: list[str] = []
-        self.tokens_used: int = 0
+    apps: list[SampleApp] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    tokens_used: int = 0
 
     @property
     def success(self) -> bool:
@@ -41,6 +54,18 @@ class GenerationResult:
             "tokens_used": self.tokens_used,
         }
 
+    def merge(self, other: GenerationResult) -> None:
+        """
+        Fold another result into this one.
+
+        Args:
+            other: Result to append after this one's entries
+        """
+        self.apps.extend(other.apps)
+        self.errors.extend(other.errors)
+        self.skipped.extend(other.skipped)
+        self.tokens_used += other.tokens_used
+
 
 async def generate_all(
     architectures: list[Architecture],
@@ -48,16 +73,29 @@ async def generate_all(
     skip_cache: bool = False,
     validate_only: bool = False,
     token_budget: Optional[int] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    use_batch_api: bool = False,
 ) -> GenerationResult:
     """
     Generate sample applications for all architectures.
 
+    Architectures are processed concurrently, at most ``max_concurrency``
+    at a time. Each produces its own GenerationResult, and these are merged
+    in input order.
+
+    With ``use_batch_api``, uncached architectures are first submitted
+    together through the Message Batches API (discounted, but slower to
+    return); any the batch does not produce fall back to the concurrent
+    path.
+
     Args:
         architectures: List of architectures to generate apps for
         cache_dir: Directory for caching
         skip_cache: Force regeneration
         validate_only: Only validate, don't save
         token_budget: Maximum tokens to use
+        max_concurrency: Maximum architectures generated at once
+        use_batch_api: Generate through a single message batch
 
     Returns:
         GenerationResult with generated apps
@@ -72,61 +110,119 @@ async def generate_all(
     # Initialize synthesizer
     synthesizer = CodeSynthesizer(cache_dir=str(cache_dir))
     validator = CodeValidator()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    total = len(architectures)
 
     logger.info(
         "generation_started",
-        architectures=len(architectures),
+        architectures=total,
         token_budget=tracker.budget.budget,
+        max_concurrency=max_concurrency,
     )
 
-    for i, arch in enumerate(architectures):
-        logger.info(
-            "processing_architecture",
-            index=i + 1,
-            total=len(architectures),
-            arch_id=arch.id,
-        )
+    def budget_exhausted(arch: Architecture) -> bool:
+        if tracker.exhausted_event.is_set():
+            logger.warning(
+                "token_budget_exhausted",
+                arch_id=arch.id,
+                remaining=tracker.remaining,
+            )
+            return True
+        return False
+
+    # Apps served without a fresh API call: from the batch, or from the
+    # cache when batch mode already looked it up
+    batch_results: dict[str, SynthesisResult] = {}
+    cached: dict[str, SynthesisResult] = {}
+    cache_checked = use_batch_api and not tracker.exhausted_event.is_set()
+    if cache_checked:
+        to_submit: list[Architecture] = []
+        for arch in architectures:
+            hit = None if skip_cache else synthesizer.load_cached(arch)
+            if hit is None:
+                to_submit.append(arch)
+            else:
+                cached[arch.id] = hit
+        # Submit only what the remaining budget covers; the batch records
+        # its usage in the tracker before the per-architecture checks run,
+        # and anything left out goes through the budget-checked path below
+        affordable = tracker.remaining // ESTIMATED_TOKENS_PER_PROBE
+        if len(to_submit) > affordable:
+            logger.warning(
+                "batch_capped_by_budget",
+                requested=len(to_submit),
+                submitted=affordable,
+                remaining=tracker.remaining,
+            )
+            to_submit = to_submit[:affordable]
+        try:
+            batch_results = await synthesizer.synthesize_batch(to_submit)
+        except Exception as e:
+            logger.warning("batch_generation_failed", error=str(e))
+
+    async def process_one(index: int, arch: Architecture) -> GenerationResult:
+        # Apps from the batch or already cached under this architecture's
+        # content key need no LLM roundtrip, so they skip the budget check
+        # and the slot wait
+        synthesis = batch_results.get(arch.id) or cached.get(arch.id)
+        if synthesis is None and not skip_cache and not cache_checked:
+            synthesis = synthesizer.load_cached(arch)
+
+        if synthesis is None:
+            # Check token budget before queueing and again once a slot frees
+            # up, so tasks still waiting can short-circuit
+            if budget_exhausted(arch):
+                return GenerationResult(skipped=[arch.id])
+
+            async with semaphore:
+                if budget_exhausted(arch):
+                    return GenerationResult(skipped=[arch.id])
+
+                logger.info(
+                    "processing_architecture",
+                    index=index + 1,
+                    total=total,
+                    arch_id=arch.id,
+                )
 
-        # Check token budget
-        if tracker.exhausted:
-            logger.warning("token_budget_exhausted", remaining=tracker.remaining)
-            result.skipped.append(arch.id)
-            continue
+                # Note: Rate limiting delays are handled inside the synthesizer
+                # Each API call waits before executing (for Tier 1 limits)
 
-        # Note: Rate limiting delays are handled inside the synthesizer
-        # Each API call waits 35 seconds before executing (for Tier 1 limits)
+                try:
+                    # Generate application
+                    synthesis = await synthesizer.synthesize(arch, skip_cache=skip_cache)
+                except Exception as e:
+                    logger.error("generation_failed", arch_id=arch.id, error=str(e))
+                    return GenerationResult(errors=[f"{arch.id}: {e}"])
 
         try:
-            # Generate application
-            synthesis = await synthesizer.synthesize(arch, skip_cache=skip_cache)
-
             if not synthesis.success:
-                result.errors.extend(
-                    f"{arch.id}: {e}" for e in synthesis.errors
+                return GenerationResult(
+                    errors=[f"{arch.id}: {e}" for e in synthesis.errors]
                 )
-                continue
 
-            result.tokens_used += synthesis.tokens_used
+            outcome = GenerationResult(tokens_used=synthesis.tokens_used)
 
-            # Validate generated code
-            validation = validate_all_files(
+            # Validate generated code off the event loop, so other
+            # architectures' responses keep being handled meanwhile
+            validation = await asyncio.to_thread(
+                validate_all_files,
                 synthesis.source_code,
                 synthesis.test_code,
             )
 
             if validation.has_errors:
-                result.errors.append(
+                outcome.errors.append(
                     f"{arch.id}: Validation failed - {validation.syntax_errors}"
                 )
-                continue
+                return outcome
 
             if validate_only:
                 logger.info("validation_only", arch_id=arch.id, valid=True)
-                continue
+                return outcome
 
             # Create SampleApp
-            app = synthesizer.create_sample_app(arch, synthesis)
-            result.apps.append(app)
+            outcome.apps.append(synthesizer.create_sample_app(arch, synthesis))
 
             logger.debug(
                 "app_generated",
@@ -134,11 +230,18 @@ async def generate_all(
                 source_files=len(synthesis.source_code),
                 test_files=len(synthesis.test_code),
             )
+            return outcome
 
         except Exception as e:
-            error_msg = f"{arch.id}: {e}"
-            result.errors.append(error_msg)
             logger.error("generation_failed", arch_id=arch.id, error=str(e))
+            return GenerationResult(errors=[f"{arch.id}: {e}"])
+
+    outcomes = await asyncio.gather(
+        *(process_one(i, arch) for i, arch in enumerate(architectures))
+    )
+
+    for outcome in outcomes:
+        result.merge(outcome)
 
     logger.info(
         "generation_completed",
@@ -154,6 +257,7 @@ async def generate_all(
 __all__ = [
     # Main function
     "generate_all",
+    "DEFAULT_MAX_CONCURRENCY",
     "GenerationResult",
     # Analyzer
     "TerraformAnalyzer",
@@ -161,6 +265,9 @@ __all__ = [
     # Synthesizer
     "CodeSynthesizer",
     "SynthesisResult",
+    "app_cache_key",
+    "architecture_cache_key",
+    "probe_cache_key",
     # Validator
     "CodeValidator",
     "ValidationResult",
@@ -2,16 +2,308 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
+import importlib
+import os
 import re
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Collection, Iterable, Iterator, Optional
 
 from src.utils.logging import get_logger
 
 logger = get_logger("generator.analyzer")
 
+# Optional engine for the resource scanning regexes, opted into with
+# LSA_REGEX_BACKEND=re2 (google-re2, linear time) or =regex; anything else,
+# or a backend that is not installed, uses the standard library re
+_REGEX_BACKENDS = ("re2", "regex")
 
-@dataclass
+
+def _load_regex_backend() -> tuple[str, Any]:
+    """Import the configured regex backend, falling back to ``re``."""
+    name = os.environ.get("LSA_REGEX_BACKEND", "re").strip().lower()
+    if name not in _REGEX_BACKENDS:
+        return "re", re
+    try:
+        return name, importlib.import_module(name)
+    except ImportError:
+        logger.warning("regex_backend_unavailable", backend=name, fallback="re")
+        return "re", re
+
+
+_REGEX_BACKEND, _re_backend = _load_regex_backend()
+
+
+def _compile(pattern: str) -> Any:
+    """
+    Compile an ASCII-only pattern with the configured regex backend.
+
+    RE2 character classes are always ASCII and it takes no ``re`` flags;
+    the other backends get their ASCII flag.
+    """
+    if _REGEX_BACKEND == "re2":
+        return _re_backend.compile(pattern)
+    return _re_backend.compile(pattern, _re_backend.ASCII)
+
+
+# resource "aws_lambda_function" "my_function" {
+# Keywords and AWS type names are lowercase; only the local name may be
+# mixed case, so that class spells out both cases instead of case folding
+_HEADER_RE = _compile(
+    r'resource\s+"(aws_[a-z0-9_]+)"\s+"([A-Za-z0-9_]+)"\s*\{'
+)
+
+# Tokens that matter when matching braces: braces, string and comment starts
+_BLOCK_TOKEN_RE = re.compile(r'[{}"#]|//|/\*')
+_STRING_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"')
+
+# _scan_block result when a chunk ends mid-block
+_NEED_MORE = -2
+
+# Characters kept between chunks when no block is open, enough to hold a
+# resource header cut off at the end of a chunk
+_HEADER_CARRY = 512
+
+# Key attributes of a resource block, one named group per attribute
+_ATTR_RE = _compile(
+    r'(?:function_name|name|bucket|table_name)\s*=\s*"(?P<name>[^"]+)"'
+    r'|handler\s*=\s*"(?P<handler>[^"]+)"'
+    r'|runtime\s*=\s*"(?P<runtime>[^"]+)"'
+    r'|memory_size\s*=\s*(?P<memory_size>\d+)'
+    r'|timeout\s*=\s*(?P<timeout>\d+)'
+    r'|hash_key\s*=\s*"(?P<hash_key>[^"]+)"'
+    r'|billing_mode\s*=\s*"(?P<billing_mode>[^"]+)"'
+)
+
+
+# Terraform resource types (without the aws_ prefix) mapped to AWS services;
+# unlisted types fall back to the first part of the type name
+_SERVICE_MAP: dict[str, str] = {
+    "lambda_function": "lambda",
+    "lambda_permission": "lambda",
+    "lambda_event_source_mapping": "lambda",
+    "s3_bucket": "s3",
+    "s3_bucket_object": "s3",
+    "s3_bucket_notification": "s3",
+    "dynamodb_table": "dynamodb",
+    "dynamodb_table_item": "dynamodb",
+    "sqs_queue": "sqs",
+    "sqs_queue_policy": "sqs",
+    "sns_topic": "sns",
+    "sns_topic_subscription": "sns",
+    "api_gateway_rest_api": "apigateway",
+    "api_gateway_resource": "apigateway",
+    "api_gateway_method": "apigateway",
+    "apigatewayv2_api": "apigatewayv2",
+    "apigatewayv2_route": "apigatewayv2",
+    "apigatewayv2_integration": "apigatewayv2",
+    "iam_role": "iam",
+    "iam_policy": "iam",
+    "cloudwatch_log_group": "cloudwatch",
+    "cloudwatch_metric_alarm": "cloudwatch",
+    "sfn_state_machine": "stepfunctions",
+    "kinesis_stream": "kinesis",
+    "eventbridge_rule": "eventbridge",
+    "cloudwatch_event_rule": "eventbridge",
+}
+
+
+# Output bucket for each resource type the finders report; types sharing a
+# bucket are listed together, in source order
+_NAME_BUCKETS = {
+    "aws_lambda_function": "lambda",
+    "aws_api_gateway_rest_api": "api",
+    "aws_apigatewayv2_api": "api",
+    "aws_s3_bucket": "storage",
+    "aws_dynamodb_table": "database",
+    "aws_sqs_queue": "queue",
+    "aws_sns_topic": "event",
+    "aws_cloudwatch_event_rule": "event",
+    "aws_eventbridge_rule": "event",
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _service_for_type(resource_type: str) -> str:
+    """
+    Map a Terraform resource type to its AWS service name.
+
+    Memoized, since large configurations repeat a small set of types.
+
+    Args:
+        resource_type: Terraform resource type (e.g. "aws_lambda_function")
+
+    Returns:
+        Service name
+    """
+    # Remove aws_ prefix
+    type_without_prefix = resource_type.replace("aws_", "")
+
+    # Check direct mapping, else fall back to the first part
+    return (
+        _SERVICE_MAP.get(type_without_prefix)
+        or type_without_prefix.split("_", 1)[0]
+    )
+
+
+def _scan_block(
+    content: str,
+    pos: int,
+    depth: int,
+    final: bool,
+) -> tuple[int, int, int]:
+    """
+    Walk a block towards its closing brace.
+
+    Skips over quoted strings and ``#``, ``//`` and ``/* */`` comments, so
+    braces inside them do not count. When ``final`` is false, ``content``
+    may continue in a later chunk: a string, comment or ``/`` cut off at
+    the end stops the walk so it can resume once more text arrives.
+
+    Args:
+        content: Terraform HCL content
+        pos: Index to resume from (the opening ``{`` for a new block)
+        depth: Brace depth at ``pos``
+        final: Whether ``content`` is the complete input
+
+    Returns:
+        Tuple of (end, pos, depth): ``end`` is the index of the matching
+        ``}``, -1 if the block is never closed, or _NEED_MORE together
+        with the ``pos`` and ``depth`` to resume from
+    """
+    while True:
+        token = _BLOCK_TOKEN_RE.search(content, pos)
+        if token is None:
+            if final:
+                return -1, pos, depth
+            # A trailing "/" may start a comment in the next chunk
+            resume = len(content) - 1 if content.endswith("/") else len(content)
+            return _NEED_MORE, max(pos, resume), depth
+        start = token.start()
+        text = token.group()
+        if text == "{":
+            depth += 1
+            pos = start + 1
+        elif text == "}":
+            depth -= 1
+            if depth == 0:
+                return start, start + 1, 0
+            pos = start + 1
+        elif text == '"':
+            string = _STRING_RE.match(content, start)
+            if string:
+                pos = string.end()
+            elif final or content.find("\n", start) != -1:
+                pos = start + 1
+            else:
+                return _NEED_MORE, start, depth
+        else:
+            terminator = "*/" if text == "/*" else "\n"
+            end = content.find(terminator, start + len(text))
+            if end == -1:
+                return (-1, pos, depth) if final else (_NEED_MORE, start, depth)
+            pos = end + len(terminator)
+
+
+class _ResourceBlockScanner:
+    """
+    Incremental scanner that yields resource blocks from chunked HCL.
+
+    Only the block being walked, or a short tail that may hold a partial
+    header, is kept between chunks, so memory is bounded by the largest
+    resource block rather than the whole input.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty scanner."""
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        # (resource type, resource name, body start) of the open block
+        self._header: Optional[tuple[str, str, int]] = None
+
+    def feed(self, chunk: str) -> Iterator[tuple[str, str, str]]:
+        """
+        Add a chunk of input.
+
+        Yields:
+            (resource type, resource name, block body) for each block
+            completed by this chunk
+        """
+        self._buf += chunk
+        yield from self._scan(final=False)
+
+    def close(self) -> Iterator[tuple[str, str, str]]:
+        """
+        Finish the input, resolving anything held back.
+
+        Yields:
+            (resource type, resource name, block body) for remaining blocks
+        """
+        yield from self._scan(final=True)
+        self._buf = ""
+
+    def _scan(self, final: bool) -> Iterator[tuple[str, str, str]]:
+        """Yield every block that can be completed from the buffer."""
+        buf = self._buf
+        while True:
+            if self._header is None:
+                match = _HEADER_RE.search(buf, self._pos)
+                if match is None:
+                    break
+                self._header = (match.group(1), match.group(2), match.end())
+                self._pos = match.end() - 1
+                self._depth = 0
+
+            end, self._pos, self._depth = _scan_block(buf, self._pos, self._depth, final)
+            if end == _NEED_MORE:
+                break
+
+            resource_type, resource_name, body_start = self._header
+            self._header = None
+            if end == -1:
+                # Unclosed block; look for the next header inside it
+                self._pos = body_start
+                continue
+            self._pos = end + 1
+            yield resource_type, resource_name, buf[body_start:end]
+
+        if final:
+            return
+
+        # Drop consumed text, keeping the open block or a possible
+        # partial header at the end
+        if self._header is not None:
+            keep = self._header[2]
+        else:
+            keep = max(self._pos, len(buf) - _HEADER_CARRY)
+        if keep:
+            self._buf = buf[keep:]
+            self._pos -= keep
+            if self._header is not None:
+                resource_type, resource_name, body_start = self._header
+                self._header = (resource_type, resource_name, body_start - keep)
+
+
+def _iter_resource_blocks(chunks: Iterable[str]) -> Iterator[tuple[str, str, str]]:
+    """
+    Yield the resource blocks in chunked Terraform content.
+
+    Args:
+        chunks: Terraform HCL content, in order (e.g. a text file object)
+
+    Yields:
+        (resource type, resource name, block body) tuples in file order
+    """
+    scanner = _ResourceBlockScanner()
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    yield from scanner.close()
+
+
+@dataclass(slots=True, frozen=True)
 class ResourceInfo:
     """Information about a Terraform resource."""
 
@@ -19,14 +311,27 @@ class ResourceInfo:
     resource_name: str
     service: str
     attributes: dict[str, Any] = field(default_factory=dict)
+    # The "name" attribute when set, else resource_name
+    display_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class InfrastructureAnalysis:
-    """Result of analyzing Terraform infrastructure."""
+    """
+    Result of analyzing Terraform infrastructure.
+
+    Resources are stored column-wise: the ``resource_*`` lists are parallel,
+    one entry per resource in file order. ``resources`` rebuilds
+    ResourceInfo records from them for callers that want one object per
+    resource.
+    """
 
-    resources: list[ResourceInfo]
-    services: set[str]
+    resource_types: list[str]
+    resource_names: list[str]
+    resource_services: list[str]
+    resource_attributes: list[dict[str, Any]]
+    resource_display_names: list[str]
+    services: tuple[str, ...]
     integration_points: list[tuple[str, str]]
     lambda_functions: list[str]
     api_endpoints: list[str]
@@ -34,17 +339,57 @@ class InfrastructureAnalysis:
     database_tables: list[str]
     queue_resources: list[str]
     event_sources: list[str]
+    # Filled on first access to joined_fields; a slot stands in for
+    # cached_property, which slotted dataclasses cannot use
+    _joined_fields: Optional[tuple[tuple[str, str], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def joined_fields(self) -> tuple[tuple[str, str], ...]:
+        """
+        Comma-joined summary fields, computed once per analysis.
+
+        Services are sorted; empty resource lists read "None". Returned as
+        hashable (name, value) pairs, so ``dict()`` of the result gives
+        prompt template values.
+        """
+        if self._joined_fields is None:
+            self._joined_fields = (
+                ("services", ", ".join(sorted(self.services))),
+                ("lambda_functions", ", ".join(self.lambda_functions) or "None"),
+                ("api_endpoints", ", ".join(self.api_endpoints) or "None"),
+                ("storage_resources", ", ".join(self.storage_resources) or "None"),
+                ("database_tables", ", ".join(self.database_tables) or "None"),
+                ("queue_resources", ", ".join(self.queue_resources) or "None"),
+                ("event_sources", ", ".join(self.event_sources) or "None"),
+            )
+        return self._joined_fields
+
+    @property
+    def resources(self) -> list[ResourceInfo]:
+        """Resources as ResourceInfo records, in file order."""
+        return [
+            ResourceInfo(*row)
+            for row in zip(
+                self.resource_types,
+                self.resource_names,
+                self.resource_services,
+                self.resource_attributes,
+                self.resource_display_names,
+            )
+        ]
 
     @property
     def resource_count(self) -> int:
         """Total number of resources."""
-        return len(self.resources)
+        return len(self.resource_types)
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
             "resource_count": self.resource_count,
-            "services": list(self.services),
+            "services": self.services,
             "lambda_functions": self.lambda_functions,
             "api_endpoints": self.api_endpoints,
             "storage_resources": self.storage_resources,
@@ -64,78 +409,110 @@ class TerraformAnalyzer:
 
     def __init__(self) -> None:
         """Initialize the analyzer."""
-        pass
+        # Analyses keyed by a digest of the Terraform content
+        self._cache: dict[bytes, InfrastructureAnalysis] = {}
 
     def analyze(self, terraform_content: str) -> InfrastructureAnalysis:
         """
         Analyze Terraform content to extract infrastructure details.
 
+        Results are cached per analyzer by content, so analyzing the same
+        Terraform again returns a copy of the earlier analysis.
+
         Args:
             terraform_content: Terraform HCL content
 
         Returns:
             InfrastructureAnalysis with extracted details
         """
-        resources = self._extract_resources(terraform_content)
-        services = self._extract_services(resources)
+        key = hashlib.blake2b(terraform_content.encode(), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        analysis = self.analyze_stream((terraform_content,))
+        self._cache[key] = analysis
+        return copy.deepcopy(analysis)
+
+    def analyze_stream(self, chunks: Iterable[str]) -> InfrastructureAnalysis:
+        """
+        Analyze Terraform content supplied in chunks.
+
+        Resource blocks are extracted as the chunks arrive, so the whole
+        input is never held in memory at once. Results are not cached.
+
+        Args:
+            chunks: Terraform HCL content, in order (e.g. a text file object)
+
+        Returns:
+            InfrastructureAnalysis with extracted details
+        """
+        types, names, resource_services, attributes, display_names = self._extract_resources(
+            chunks
+        )
+        services = self._extract_services(resource_services)
+
+        # Display names sorted into the finders' buckets in one pass, so
+        # each finder reads only its own resources, in source order
+        by_bucket: dict[str, list[str]] = {}
+        for resource_type, display_name in zip(types, display_names):
+            bucket = _NAME_BUCKETS.get(resource_type)
+            if bucket is not None:
+                by_bucket.setdefault(bucket, []).append(display_name)
 
         analysis = InfrastructureAnalysis(
-            resources=resources,
+            resource_types=types,
+            resource_names=names,
+            resource_services=resource_services,
+            resource_attributes=attributes,
+            resource_display_names=display_names,
             services=services,
-            integration_points=self._find_integration_points(resources),
-            lambda_functions=self._find_lambda_functions(resources),
-            api_endpoints=self._find_api_endpoints(resources),
-            storage_resources=self._find_storage_resources(resources),
-            database_tables=self._find_database_tables(resources),
-            queue_resources=self._find_queue_resources(resources),
-            event_sources=self._find_event_sources(resources),
+            integration_points=self._find_integration_points(services),
+            lambda_functions=self._find_lambda_functions(by_bucket),
+            api_endpoints=self._find_api_endpoints(by_bucket),
+            storage_resources=self._find_storage_resources(by_bucket),
+            database_tables=self._find_database_tables(by_bucket),
+            queue_resources=self._find_queue_resources(by_bucket),
+            event_sources=self._find_event_sources(by_bucket),
         )
 
         logger.debug(
             "terraform_analyzed",
-            resources=len(resources),
-            services=list(services),
+            resources=len(types),
+            services=services,
         )
 
         return analysis
 
-    def _extract_resources(self, content: str) -> list[ResourceInfo]:
+    def _extract_resources(
+        self,
+        chunks: Iterable[str],
+    ) -> tuple[list[str], list[str], list[str], list[dict[str, Any]], list[str]]:
         """
         Extract all resources from Terraform content.
 
         Args:
-            content: Terraform HCL content
+            chunks: Terraform HCL content, in order
 
         Returns:
-            List of ResourceInfo objects
+            Parallel lists of (resource types, resource names, services,
+            attributes, display names), one entry per resource
         """
-        resources = []
-
-        # Pattern to match resource blocks
-        # resource "aws_lambda_function" "my_function" { ... }
-        pattern = r'resource\s+"(aws_[a-z0-9_]+)"\s+"([a-z0-9_]+)"\s*\{([^}]*(?:\{[^}]*\}[^}]*)*)\}'
-
-        for match in re.finditer(pattern, content, re.IGNORECASE | re.DOTALL):
-            resource_type = match.group(1)
-            resource_name = match.group(2)
-            block_content = match.group(3)
-
-            # Extract key attributes
-            attributes = self._parse_attributes(block_content)
-
-            # Determine service
-            service = self._resource_type_to_service(resource_type)
-
-            resources.append(
-                ResourceInfo(
-                    resource_type=resource_type,
-                    resource_name=resource_name,
-                    service=service,
-                    attributes=attributes,
-                )
-            )
-
-        return resources
+        types: list[str] = []
+        names: list[str] = []
+        services: list[str] = []
+        attributes: list[dict[str, Any]] = []
+        display_names: list[str] = []
+
+        for resource_type, resource_name, block_content in _iter_resource_blocks(chunks):
+            types.append(resource_type)
+            names.append(resource_name)
+            services.append(_service_for_type(resource_type))
+            attrs = self._parse_attributes(block_content)
+            attributes.append(attrs)
+            display_names.append(attrs.get("name", resource_name))
+
+        return types, names, services, attributes, display_names
 
     def _parse_attributes(self, block_content: str) -> dict[str, Any]:
         """
@@ -149,80 +526,28 @@ class TerraformAnalyzer:
         """
         attributes = {}
 
-        # Extract common attributes
-        patterns = {
-            "name": r'(?:function_name|name|bucket|table_name)\s*=\s*"([^"]+)"',
-            "handler": r'handler\s*=\s*"([^"]+)"',
-            "runtime": r'runtime\s*=\s*"([^"]+)"',
-            "memory_size": r'memory_size\s*=\s*(\d+)',
-            "timeout": r'timeout\s*=\s*(\d+)',
-            "hash_key": r'hash_key\s*=\s*"([^"]+)"',
-            "billing_mode": r'billing_mode\s*=\s*"([^"]+)"',
-        }
-
-        for attr_name, pattern in patterns.items():
-            match = re.search(pattern, block_content)
-            if match:
-                attributes[attr_name] = match.group(1)
+        # Extract common attributes in one pass; the first match wins
+        for match in _ATTR_RE.finditer(block_content):
+            attr_name = match.lastgroup
+            if attr_name not in attributes:
+                attributes[attr_name] = match.group(attr_name)
 
         return attributes
 
-    def _extract_services(self, resources: list[ResourceInfo]) -> set[str]:
-        """Extract unique services from resources."""
-        return {r.service for r in resources if r.service}
+    def _extract_services(self, resource_services: list[str]) -> tuple[str, ...]:
+        """Extract unique services from the per-resource service column, in file order."""
+        return tuple(dict.fromkeys(service for service in resource_services if service))
 
     def _resource_type_to_service(self, resource_type: str) -> str:
         """Map Terraform resource type to AWS service name."""
-        # Remove aws_ prefix
-        type_without_prefix = resource_type.replace("aws_", "")
-
-        # Common mappings
-        service_map = {
-            "lambda_function": "lambda",
-            "lambda_permission": "lambda",
-            "lambda_event_source_mapping": "lambda",
-            "s3_bucket": "s3",
-            "s3_bucket_object": "s3",
-            "s3_bucket_notification": "s3",
-            "dynamodb_table": "dynamodb",
-            "dynamodb_table_item": "dynamodb",
-            "sqs_queue": "sqs",
-            "sqs_queue_policy": "sqs",
-            "sns_topic": "sns",
-            "sns_topic_subscription": "sns",
-            "api_gateway_rest_api": "apigateway",
-            "api_gateway_resource": "apigateway",
-            "api_gateway_method": "apigateway",
-            "apigatewayv2_api": "apigatewayv2",
-            "apigatewayv2_route": "apigatewayv2",
-            "apigatewayv2_integration": "apigatewayv2",
-            "iam_role": "iam",
-            "iam_policy": "iam",
-            "cloudwatch_log_group": "cloudwatch",
-            "cloudwatch_metric_alarm": "cloudwatch",
-            "sfn_state_machine": "stepfunctions",
-            "kinesis_stream": "kinesis",
-            "eventbridge_rule": "eventbridge",
-            "cloudwatch_event_rule": "eventbridge",
-        }
-
-        # Check direct mapping
-        if type_without_prefix in service_map:
-            return service_map[type_without_prefix]
-
-        # Fall back to first part
-        parts = type_without_prefix.split("_")
-        return parts[0] if parts else "unknown"
+        return _service_for_type(resource_type)
 
-    def _find_integration_points(
-        self,
-        resources: list[ResourceInfo],
-    ) -> list[tuple[str, str]]:
+    def _find_integration_points(self, services: Collection[str]) -> list[tuple[str, str]]:
         """
         Find integration points between services.
 
         Args:
-            resources: List of resources
+            services: Services present in the configuration
 
         Returns:
             List of (source, target) tuples
@@ -230,80 +555,55 @@ class TerraformAnalyzer:
         integrations = []
 
         # Common integration patterns
-        lambda_resources = [r for r in resources if r.service == "lambda"]
-        api_resources = [r for r in resources if r.service in ("apigateway", "apigatewayv2")]
-        sqs_resources = [r for r in resources if r.service == "sqs"]
-        sns_resources = [r for r in resources if r.service == "sns"]
-        dynamodb_resources = [r for r in resources if r.service == "dynamodb"]
+        has_lambda = "lambda" in services
+        has_api = "apigateway" in services or "apigatewayv2" in services
 
         # API Gateway -> Lambda
-        if api_resources and lambda_resources:
+        if has_api and has_lambda:
             integrations.append(("apigateway", "lambda"))
 
         # SQS -> Lambda (event source mapping)
-        if sqs_resources and lambda_resources:
+        if "sqs" in services and has_lambda:
             integrations.append(("sqs", "lambda"))
 
         # SNS -> Lambda
-        if sns_resources and lambda_resources:
+        if "sns" in services and has_lambda:
             integrations.append(("sns", "lambda"))
 
         # Lambda -> DynamoDB
-        if lambda_resources and dynamodb_resources:
+        if has_lambda and "dynamodb" in services:
             integrations.append(("lambda", "dynamodb"))
 
         # Lambda -> S3
-        s3_resources = [r for r in resources if r.service == "s3"]
-        if lambda_resources and s3_resources:
+        if has_lambda and "s3" in services:
             integrations.append(("lambda", "s3"))
 
         return integrations
 
-    def _find_lambda_functions(self, resources: list[ResourceInfo]) -> list[str]:
+    def _resource_names(self, by_bucket: dict[str, list[str]], bucket: str) -> list[str]:
+        """Names of the resources in one finder bucket, in source order."""
+        return list(by_bucket.get(bucket, ()))
+
+    def _find_lambda_functions(self, by_bucket: dict[str, list[str]]) -> list[str]:
         """Find Lambda function names."""
-        return [
-            r.attributes.get("name", r.resource_name)
-            for r in resources
-            if r.resource_type == "aws_lambda_function"
-        ]
+        return self._resource_names(by_bucket, "lambda")
 
-    def _find_api_endpoints(self, resources: list[ResourceInfo]) -> list[str]:
+    def _find_api_endpoints(self, by_bucket: dict[str, list[str]]) -> list[str]:
         """Find API Gateway endpoints."""
-        endpoints = []
-        for r in resources:
-            if r.resource_type in ("aws_api_gateway_rest_api", "aws_apigatewayv2_api"):
-                endpoints.append(r.attributes.get("name", r.resource_name))
-        return endpoints
+        return self._resource_names(by_bucket, "api")
 
-    def _find_storage_resources(self, resources: list[ResourceInfo]) -> list[str]:
+    def _find_storage_resources(self, by_bucket: dict[str, list[str]]) -> list[str]:
         """Find S3 bucket names."""
-        return [
-            r.attributes.get("name", r.resource_name)
-            for r in resources
-            if r.resource_type == "aws_s3_bucket"
-        ]
+        return self._resource_names(by_bucket, "storage")
 
-    def _find_database_tables(self, resources: list[ResourceInfo]) -> list[str]:
+    def _find_database_tables(self, by_bucket: dict[str, list[str]]) -> list[str]:
         """Find DynamoDB table names."""
-        return [
-            r.attributes.get("name", r.resource_name)
-            for r in resources
-            if r.resource_type == "aws_dynamodb_table"
-        ]
+        return self._resource_names(by_bucket, "database")
 
-    def _find_queue_resources(self, resources: list[ResourceInfo]) -> list[str]:
+    def _find_queue_resources(self, by_bucket: dict[str, list[str]]) -> list[str]:
         """Find SQS queue names."""
-        return [
-            r.attributes.get("name", r.resource_name)
-            for r in resources
-            if r.resource_type == "aws_sqs_queue"
-        ]
+        return self._resource_names(by_bucket, "queue")
 
-    def _find_event_sources(self, resources: list[ResourceInfo]) -> list[str]:
+    def _find_event_sources(self, by_bucket: dict[str, list[str]]) -> list[str]:
         """Find event source resources (SNS, EventBridge, etc.)."""
-        event_types = ("aws_sns_topic", "aws_cloudwatch_event_rule", "aws_eventbridge_rule")
-        return [
-            r.attributes.get("name", r.resource_name)
-            for r in resources
-            if r.resource_type in event_types
-        ]
+        return self._resource_names(by_bucket, "event")
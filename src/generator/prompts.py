@@ -12,7 +12,131 @@ References:
 
 from __future__ import annotations
 
+import functools
+import sys
+from string import Formatter
+from typing import Any
+
 from src.generator.analyzer import InfrastructureAnalysis
+from src.models.probe_type import ProbeType
+from src.utils.logging import get_logger
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+logger = get_logger("generator.prompts")
+
+# Token budgets for inputs quoted into prompts
+TERRAFORM_PROMPT_TOKENS = 3000
+APP_CODE_PROMPT_TOKENS = 4500
+
+# Inputs are cut to this many characters per budgeted token before
+# tokenizing, which bounds the encoding work; code rarely averages more
+_MAX_CHARS_PER_TOKEN = 8
+
+# Characters per token assumed when tiktoken is unavailable; kept low so
+# the character cut stays within the token budget for HCL and Python
+_FALLBACK_CHARS_PER_TOKEN = 3
+
+# Upper bounds on the characters each budget can keep
+TERRAFORM_PROMPT_CHARS = TERRAFORM_PROMPT_TOKENS * _MAX_CHARS_PER_TOKEN
+APP_CODE_PROMPT_CHARS = APP_CODE_PROMPT_TOKENS * _MAX_CHARS_PER_TOKEN
+
+
+@functools.cache
+def _get_encoding() -> Any:
+    """Load the tiktoken encoding once, or None if it is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        # cl100k_base approximates Claude's tokenizer closely enough for budgeting
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:  # e.g. encoding file cannot be downloaded
+        logger.warning("tokenizer_unavailable", error=str(e))
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text to at most ``max_tokens`` tokens.
+
+    Uses tiktoken when installed and falls back to a conservative
+    character count otherwise. Results are memoized, so truncating the
+    same input for several prompts tokenizes it once.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+
+    Returns:
+        The longest prefix of ``text`` within the budget
+    """
+    text = text[:max_tokens * _MAX_CHARS_PER_TOKEN]
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * _FALLBACK_CHARS_PER_TOKEN]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+# A template split into literal text and the field names between it:
+# literals[i] precedes fields[i], and literals[-1] ends the template
+_CompiledTemplate = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+def _compile_template(template: str) -> _CompiledTemplate:
+    """
+    Split a ``str.format`` template into literals and field names once.
+
+    Args:
+        template: Template using plain ``{name}`` fields and ``{{``/``}}`` escapes
+
+    Returns:
+        (literals, fields) for _render
+
+    Raises:
+        ValueError: If a field uses a conversion, format spec or non-name key
+    """
+    literals: list[str] = []
+    fields: list[str] = []
+    pending = ""
+    for literal, name, spec, conversion in Formatter().parse(template):
+        pending += literal
+        if name is None:
+            continue
+        if spec or conversion or not name.isidentifier():
+            raise ValueError(f"Unsupported template field: {{{name}}}")
+        literals.append(pending)
+        fields.append(name)
+        pending = ""
+    literals.append(pending)
+    return tuple(literals), tuple(fields)
+
+
+def _render(compiled: _CompiledTemplate, values: dict[str, Any]) -> str:
+    """
+    Fill a compiled template; same result as ``template.format(**values)``.
+
+    Args:
+        compiled: Output of _compile_template
+        values: Field values by name
+
+    Returns:
+        Rendered string
+    """
+    literals, fields = compiled
+    parts = [literals[0]]
+    for literal, name in zip(literals[1:], fields):
+        parts.append(str(values[name]))
+        parts.append(literal)
+    return "".join(parts)
+
 
 # System prompt for code generation - optimized for Claude 4.x
 # Best practice: Be explicit, structured, and clear about expectations
@@ -57,22 +181,10 @@ Generate Python applications that DISCOVER GAPS in LocalStack's AWS API implemen
 ## Output Format
 Always output code in the exact format specified in the user prompt. Follow the format instructions precisely."""
 
-# Main generation prompt template
-GENERATION_PROMPT = """Generate a REALISTIC Python application that simulates a real-world business scenario using the following AWS infrastructure:
-
-## Infrastructure Analysis
-- Services: {services}
-- Lambda Functions: {lambda_functions}
-- API Endpoints: {api_endpoints}
-- Storage (S3): {storage_resources}
-- Database Tables: {database_tables}
-- Queues (SQS): {queue_resources}
-- Event Sources: {event_sources}
-
-## Terraform Configuration
-```hcl
-{terraform_content}
-```
+# Main generation prompt: static instructions only. The infrastructure they
+# apply to follows in a separate block (INFRASTRUCTURE_TEMPLATE), so this
+# prefix stays identical across calls and can be prompt-cached
+GENERATION_PROMPT = """Generate a REALISTIC Python application that simulates a real-world business scenario using the AWS infrastructure described after these instructions.
 
 ## Issue Discovery Scenarios
 
@@ -143,7 +255,7 @@ Based on the infrastructure services, generate an application that PROBES FOR LO
 AWS API parity probes:
 - One class per AWS service being tested
 - Each method tests a specific advanced feature
-- Return structured results: {feature, expected, actual, passed, error_message}
+- Return structured results: {{feature, expected, actual, passed, error_message}}
 - Use descriptive method names: test_dynamodb_transactions, test_s3_versioning
 
 ### src/validators.py
@@ -246,20 +358,9 @@ Use this EXACT format (do not embed code in JSON):
 }}
 ```"""
 
-# Test generation prompt template
-TEST_GENERATION_PROMPT = """Generate pytest tests that DISCOVER LOCALSTACK IMPLEMENTATION GAPS for the following probe application:
-
-## Probe Application Code
-```python
-{app_code}
-```
-
-## Infrastructure Services Being Tested
-- Services: {services}
-- Lambda Functions: {lambda_functions}
-- Database Tables: {database_tables}
-- Queues: {queue_resources}
-- Storage: {storage_resources}
+# Test generation prompt: static instructions only. The probe code and
+# services follow in TEST_CONTEXT_TEMPLATE
+TEST_GENERATION_PROMPT = """Generate pytest tests that DISCOVER LOCALSTACK IMPLEMENTATION GAPS for the probe application given after these instructions.
 
 ## Test Requirements
 
@@ -426,11 +527,76 @@ Use this EXACT format (do not embed code in JSON):
 }}
 ```"""
 
+# Dynamic part of the generation and probe prompts
+INFRASTRUCTURE_TEMPLATE = """## Infrastructure Analysis
+- Services: {services}
+- Lambda Functions: {lambda_functions}
+- API Endpoints: {api_endpoints}
+- Storage (S3): {storage_resources}
+- Database Tables: {database_tables}
+- Queues (SQS): {queue_resources}
+- Event Sources: {event_sources}
+
+## Terraform Configuration
+```hcl
+{terraform_content}
+```"""
+
+# Dynamic part of the test prompt
+TEST_CONTEXT_TEMPLATE = """## Probe Application Code
+```python
+{app_code}
+```
+
+## Infrastructure Services Being Tested
+- Services: {services}
+- Lambda Functions: {lambda_functions}
+- Database Tables: {database_tables}
+- Queues: {queue_resources}
+- Storage: {storage_resources}"""
+
+_GENERATION_STATIC = _render(_compile_template(GENERATION_PROMPT), {})
+_TEST_GENERATION_STATIC = _render(_compile_template(TEST_GENERATION_PROMPT), {})
+_INFRASTRUCTURE_COMPILED = _compile_template(INFRASTRUCTURE_TEMPLATE)
+_TEST_CONTEXT_COMPILED = _compile_template(TEST_CONTEXT_TEMPLATE)
+
+
+def _content_blocks(static: str, dynamic: str) -> list[dict[str, Any]]:
+    """
+    Build user message content with the static instructions cacheable.
+
+    The instructions come first and carry a cache breakpoint, so repeated
+    requests reuse the cached prefix and only the dynamic block is new.
+
+    Args:
+        static: Instructions that are identical across calls
+        dynamic: Per-call infrastructure or code context
+
+    Returns:
+        Content blocks for a user message
+    """
+    return [
+        {"type": "text", "text": static, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": dynamic},
+    ]
+
+
+@functools.lru_cache(maxsize=128)
+def _infrastructure_context(fields: tuple[tuple[str, str], ...], terraform_content: str) -> str:
+    """Render INFRASTRUCTURE_TEMPLATE, memoized on the joined fields and Terraform."""
+    return _render(_INFRASTRUCTURE_COMPILED, dict(fields, terraform_content=terraform_content))
+
+
+@functools.lru_cache(maxsize=128)
+def _test_context(fields: tuple[tuple[str, str], ...], app_code: str) -> str:
+    """Render TEST_CONTEXT_TEMPLATE, memoized on the joined fields and app code."""
+    return _render(_TEST_CONTEXT_COMPILED, dict(fields, app_code=app_code))
+
 
 def format_generation_prompt(
     analysis: InfrastructureAnalysis,
     terraform_content: str,
-) -> str:
+) -> list[dict[str, Any]]:
     """
     Format the generation prompt with infrastructure details.
 
@@ -439,24 +605,21 @@ def format_generation_prompt(
         terraform_content: Original Terraform content
 
     Returns:
-        Formatted prompt string
+        User message content blocks: cached instructions, then infrastructure
     """
-    return GENERATION_PROMPT.format(
-        services=", ".join(sorted(analysis.services)),
-        lambda_functions=", ".join(analysis.lambda_functions) or "None",
-        api_endpoints=", ".join(analysis.api_endpoints) or "None",
-        storage_resources=", ".join(analysis.storage_resources) or "None",
-        database_tables=", ".join(analysis.database_tables) or "None",
-        queue_resources=", ".join(analysis.queue_resources) or "None",
-        event_sources=", ".join(analysis.event_sources) or "None",
-        terraform_content=terraform_content[:4000],  # Limit size
+    return _content_blocks(
+        _GENERATION_STATIC,
+        _infrastructure_context(
+            analysis.joined_fields,
+            truncate_to_tokens(terraform_content, TERRAFORM_PROMPT_TOKENS),
+        ),
     )
 
 
 def format_test_prompt(
     analysis: InfrastructureAnalysis,
     app_code: str,
-) -> str:
+) -> list[dict[str, Any]]:
     """
     Format the test generation prompt.
 
@@ -465,22 +628,17 @@ def format_test_prompt(
         app_code: Generated application code
 
     Returns:
-        Formatted prompt string
+        User message content blocks: cached instructions, then probe code
     """
-    return TEST_GENERATION_PROMPT.format(
-        app_code=app_code[:6000],  # Limit size
-        services=", ".join(sorted(analysis.services)),
-        lambda_functions=", ".join(analysis.lambda_functions) or "None",
-        database_tables=", ".join(analysis.database_tables) or "None",
-        queue_resources=", ".join(analysis.queue_resources) or "None",
-        storage_resources=", ".join(analysis.storage_resources) or "None",
+    return _content_blocks(
+        _TEST_GENERATION_STATIC,
+        _test_context(
+            analysis.joined_fields,
+            truncate_to_tokens(app_code, APP_CODE_PROMPT_TOKENS),
+        ),
     )
 
 
-# Import ProbeType for type hints - avoid circular import
-from src.models.architecture import ProbeType
-
-
 # Probe-specific prompt configurations
 PROBE_CONFIGS = {
     ProbeType.API_PARITY: {
@@ -598,22 +756,17 @@ Focus on CONCURRENT OPERATIONS - testing race conditions and throughput:
 }
 
 
-# Probe-specific generation prompt template
-PROBE_GENERATION_TEMPLATE = """Generate a Python probe application to test {probe_name} for the following AWS infrastructure:
+# (name, description, focus) per probe type, unpacked by the prompt code
+# instead of indexing each config dict; the short strings are interned
+_PROBE_TABLE: dict[ProbeType, tuple[str, str, str]] = {
+    probe_type: (sys.intern(config["name"]), sys.intern(config["description"]), config["focus"])
+    for probe_type, config in PROBE_CONFIGS.items()
+}
 
-## Infrastructure Analysis
-- Services: {services}
-- Lambda Functions: {lambda_functions}
-- API Endpoints: {api_endpoints}
-- Storage (S3): {storage_resources}
-- Database Tables: {database_tables}
-- Queues (SQS): {queue_resources}
-- Event Sources: {event_sources}
 
-## Terraform Configuration
-```hcl
-{terraform_content}
-```
+# Probe-specific generation prompt template; only the probe fields vary,
+# so it is rendered once per probe type and followed by INFRASTRUCTURE_TEMPLATE
+PROBE_GENERATION_TEMPLATE = """Generate a Python probe application to test {probe_name} for the AWS infrastructure described after these instructions.
 
 ## Probe Focus
 {probe_focus}
@@ -675,12 +828,30 @@ Use this EXACT format (do not embed code in JSON):
 }}
 ```"""
 
+_PROBE_GENERATION_COMPILED = _compile_template(PROBE_GENERATION_TEMPLATE)
+
+
+def _probe_instructions(probe_type: ProbeType) -> str:
+    """Render PROBE_GENERATION_TEMPLATE for one probe type."""
+    name, _description, focus = _PROBE_TABLE.get(probe_type) or _PROBE_TABLE[ProbeType.API_PARITY]
+    return _render(_PROBE_GENERATION_COMPILED, {
+        "probe_name": name,
+        "probe_type": probe_type.value,
+        "probe_focus": focus,
+    })
+
+
+# Probe instructions rendered once per probe type
+_PROBE_STATIC: dict[ProbeType, str] = {
+    probe_type: _probe_instructions(probe_type) for probe_type in ProbeType
+}
+
 
 def get_probe_prompt(
-    probe_type: "ProbeType",
+    probe_type: ProbeType,
     analysis: InfrastructureAnalysis,
     terraform_content: str,
-) -> str:
+) -> list[dict[str, Any]]:
     """
     Get the probe-specific generation prompt.
 
@@ -690,20 +861,13 @@ def get_probe_prompt(
         terraform_content: Original Terraform content
 
     Returns:
-        Formatted prompt string for the specific probe type
+        User message content blocks: cached probe instructions, then
+        infrastructure
     """
-    config = PROBE_CONFIGS.get(probe_type, PROBE_CONFIGS[ProbeType.API_PARITY])
-
-    return PROBE_GENERATION_TEMPLATE.format(
-        probe_name=config["name"],
-        probe_type=probe_type.value,
-        probe_focus=config["focus"],
-        services=", ".join(sorted(analysis.services)),
-        lambda_functions=", ".join(analysis.lambda_functions) or "None",
-        api_endpoints=", ".join(analysis.api_endpoints) or "None",
-        storage_resources=", ".join(analysis.storage_resources) or "None",
-        database_tables=", ".join(analysis.database_tables) or "None",
-        queue_resources=", ".join(analysis.queue_resources) or "None",
-        event_sources=", ".join(analysis.event_sources) or "None",
-        terraform_content=terraform_content[:4000],
+    return _content_blocks(
+        _PROBE_STATIC[probe_type],
+        _infrastructure_context(
+            analysis.joined_fields,
+            truncate_to_tokens(terraform_content, TERRAFORM_PROMPT_TOKENS),
+        ),
     )
@@ -1,7 +1,7 @@
 """Code synthesizer using Claude API.
 
 Implements best practices from Anthropic documentation:
-- Prompt caching for system prompts (90% cost reduction)
+- Prompt caching for system prompts and static user instructions (90% cost reduction)
 - Proper rate limit handling with retry-after header
 - Temperature control for deterministic code output
 - Structured error handling with specific exception types
@@ -15,21 +15,26 @@ References:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
 import re
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import anthropic
 from anthropic import APIError, APIConnectionError, RateLimitError, APIStatusError
 
 from src.generator.analyzer import InfrastructureAnalysis, TerraformAnalyzer
 from src.generator.prompts import (
+    APP_CODE_PROMPT_CHARS,
     SYSTEM_PROMPT,
+    TERRAFORM_PROMPT_TOKENS,
     format_generation_prompt,
     format_test_prompt,
     get_probe_prompt,
+    truncate_to_tokens,
     PROBE_CONFIGS,
 )
 from src.models import Architecture, SampleApp, ProbeType
@@ -61,6 +66,96 @@ MAX_OUTPUT_TOKENS = 16384
 # Adding buffer for safety
 MIN_REQUEST_DELAY_SECONDS = 130.0
 
+# Approximate tokens one probe app (code plus tests) uses, for budget checks
+ESTIMATED_TOKENS_PER_PROBE = 10000
+
+# Seconds between status checks of a submitted message batch
+BATCH_POLL_INTERVAL_SECONDS = 30.0
+
+# Top-level keys of a JSON code response that are kept as app metadata
+_RESPONSE_METADATA_KEYS = frozenset({"requirements", "probed_features", "probe_name"})
+
+
+def _join_app_code(files: dict[str, str], limit: int = APP_CODE_PROMPT_CHARS) -> str:
+    """
+    Join source files for the test prompt, stopping once ``limit`` is reached.
+
+    Same result as ``"\n\n".join(files.values())[:limit]`` without joining
+    files that would be cut off anyway.
+    """
+    parts: list[str] = []
+    size = 0
+    for code in files.values():
+        parts.append(code)
+        size += len(code) + 2
+        if size >= limit:
+            break
+    return "\n\n".join(parts)[:limit]
+
+
+def _message_text(message: Any) -> Optional[str]:
+    """Text of a response message's first text block, or None if it has none."""
+    for block in getattr(message, "content", None) or ():
+        if getattr(block, "type", "text") == "text":
+            return getattr(block, "text", None)
+    return None
+
+
+def architecture_cache_key(architecture: Architecture) -> str:
+    """
+    Default app-cache key for an architecture.
+
+    Keyed by Terraform content rather than id, so identical architectures
+    found under different ids share generated apps.
+
+    Args:
+        architecture: Architecture to key
+
+    Returns:
+        The architecture's content hash, or a blake2b digest of its
+        Terraform files when no hash has been recorded
+    """
+    if architecture.content_hash:
+        return architecture.content_hash
+    digest = hashlib.blake2b(digest_size=16)
+    for content in (architecture.main_tf, architecture.variables_tf, architecture.outputs_tf):
+        digest.update((content or "").encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def probe_cache_key(base_key: str, probe_type: ProbeType) -> str:
+    """
+    App-cache key for one probe, given an architecture's base key.
+
+    Args:
+        base_key: Architecture key (e.g. from ``architecture_cache_key``)
+        probe_type: Probe the app exercises
+
+    Returns:
+        Key of the form ``{base_key}_{probe}``
+    """
+    return f"{base_key}_{probe_type.value}"
+
+
+def app_cache_key(
+    architecture: Architecture,
+    probe_type: ProbeType,
+    key_fn: Callable[[Architecture], str] = architecture_cache_key,
+) -> str:
+    """
+    App-cache key for one probe of an architecture.
+
+    Args:
+        architecture: Architecture the app was generated for
+        probe_type: Probe the app exercises
+        key_fn: Maps the architecture to its base cache key
+
+    Returns:
+        Key of the form ``{base_key}_{probe}``
+    """
+    return probe_cache_key(key_fn(architecture), probe_type)
+
 
 @dataclass
 class SynthesisResult:
@@ -112,6 +207,7 @@ class CodeSynthesizer:
         api_key: Optional[str] = None,
         model: str = "claude-sonnet-4-20250514",
         cache_dir: Optional[str] = None,
+        cache_key_fn: Callable[[Architecture], str] = architecture_cache_key,
     ) -> None:
         """
         Initialize the synthesizer.
@@ -120,12 +216,29 @@ class CodeSynthesizer:
             api_key: Anthropic API key
             model: Claude model to use
             cache_dir: Directory for caching generated apps
+            cache_key_fn: Maps an architecture to its app-cache key
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.model = model
         self.cache = AppCache(cache_dir) if cache_dir else None
+        self.cache_key_fn = cache_key_fn
         self.analyzer = TerraformAnalyzer()
         self._client = None
+        # Shared by every task using this synthesizer, so the request delay
+        # spaces requests globally rather than per task
+        self._request_slot = asyncio.Lock()
+
+    async def _wait_for_request_slot(self) -> None:
+        """
+        Wait out the rate-limit delay before sending a request.
+
+        The delay is taken while holding a lock shared across tasks, so
+        concurrent generations still send at most one request per
+        MIN_REQUEST_DELAY_SECONDS; only the work between requests overlaps.
+        """
+        async with self._request_slot:
+            logger.debug("rate_limit_delay_before_request", delay=MIN_REQUEST_DELAY_SECONDS)
+            await asyncio.sleep(MIN_REQUEST_DELAY_SECONDS)
 
     async def _get_client(self):
         """Get or create Anthropic client optimized for Tier 1 rate limits."""
@@ -144,6 +257,42 @@ class CodeSynthesizer:
 
         return self._client
 
+    def _cache_key(self, architecture: Architecture, probe_type: ProbeType) -> str:
+        """Get the app-cache key for one probe of an architecture."""
+        return app_cache_key(architecture, probe_type, self.cache_key_fn)
+
+    def load_cached(
+        self,
+        architecture: Architecture,
+        probe_type: ProbeType = ProbeType.API_PARITY,
+    ) -> Optional[SynthesisResult]:
+        """
+        Load a previously generated probe app from the cache.
+
+        Args:
+            architecture: Architecture the app was generated for
+            probe_type: Probe type of the app
+
+        Returns:
+            SynthesisResult built from the cached app, or None on a miss
+        """
+        if self.cache is None:
+            return None
+
+        cached = self.cache.load_app(self._cache_key(architecture, probe_type))
+        if not cached:
+            return None
+
+        logger.debug("using_cached_app", arch_id=architecture.id, probe=probe_type.value)
+        return SynthesisResult(
+            probe_type=probe_type,
+            probe_name=cached.get("probe_name", ""),
+            probed_features=cached.get("probed_features", []),
+            source_code=cached.get("source_code", {}),
+            test_code=cached.get("test_code", {}),
+            requirements=cached.get("requirements", []),
+        )
+
     async def synthesize(
         self,
         architecture: Architecture,
@@ -192,8 +341,9 @@ class CodeSynthesizer:
 
         multi_result = MultiSynthesisResult()
 
-        # Analyze infrastructure once for all probes
+        # Analyze infrastructure and truncate it for the prompt once for all probes
         analysis = self.analyzer.analyze(architecture.main_tf)
+        terraform_excerpt = truncate_to_tokens(architecture.main_tf, TERRAFORM_PROMPT_TOKENS)
 
         for i, probe_type in enumerate(probe_types):
             # Add delay between probe types to avoid rate limiting
@@ -201,29 +351,16 @@ class CodeSynthesizer:
                 import asyncio
                 await asyncio.sleep(3.0)  # 3 second delay between probes
 
-            cache_key = f"{architecture.content_hash}_{probe_type.value}"
-
             # Check cache
-            if self.cache and not skip_cache:
-                cached = self.cache.load_app(cache_key)
-                if cached:
-                    logger.debug("using_cached_app", arch_id=architecture.id, probe=probe_type.value)
-                    result = SynthesisResult(
-                        probe_type=probe_type,
-                        probe_name=cached.get("probe_name", ""),
-                        probed_features=cached.get("probed_features", []),
-                        source_code=cached.get("source_code", {}),
-                        test_code=cached.get("test_code", {}),
-                        requirements=cached.get("requirements", []),
-                    )
-                    multi_result.results.append(result)
+            if not skip_cache:
+                cached = self.load_cached(architecture, probe_type)
+                if cached is not None:
+                    multi_result.results.append(cached)
                     continue
 
             # Check token budget
             tracker = TokenTracker.get_instance()
-            estimated_tokens = 10000  # Approximate tokens per probe
-
-            if not tracker.can_afford(estimated_tokens):
+            if not tracker.can_afford(ESTIMATED_TOKENS_PER_PROBE):
                 logger.warning(
                     "token_budget_exhausted",
                     arch_id=architecture.id,
@@ -242,23 +379,11 @@ class CodeSynthesizer:
                     architecture=architecture,
                     analysis=analysis,
                     probe_type=probe_type,
+                    terraform_content=terraform_excerpt,
                 )
 
                 # Cache result
-                if self.cache and result.success:
-                    self.cache.save_app(
-                        content_hash=cache_key,
-                        source_code=result.source_code,
-                        test_code=result.test_code,
-                        requirements=result.requirements,
-                        metadata={
-                            "architecture_id": architecture.id,
-                            "probe_type": probe_type.value,
-                            "probe_name": result.probe_name,
-                            "probed_features": result.probed_features,
-                            "services": list(analysis.services),
-                        },
-                    )
+                self._save_to_cache(architecture, analysis, result)
 
                 multi_result.results.append(result)
                 multi_result.total_tokens += result.tokens_used
@@ -301,11 +426,195 @@ class CodeSynthesizer:
 
         return multi_result
 
+    async def synthesize_batch(
+        self,
+        architectures: list[Architecture],
+        probe_type: ProbeType = ProbeType.API_PARITY,
+    ) -> dict[str, SynthesisResult]:
+        """
+        Synthesize one probe app per architecture through the Message Batches API.
+
+        Probe code for all architectures is submitted as one batch, then the
+        tests for every architecture that produced code as a second batch.
+        Batches are billed at a discount and need no per-request rate-limit
+        delay, at the cost of latency.
+
+        Args:
+            architectures: Architectures to generate apps for
+            probe_type: Type of probe to generate
+
+        Returns:
+            SynthesisResult per architecture id; architectures whose probe
+            request failed in the batch are omitted
+
+        Raises:
+            APIError: If a batch cannot be created or polled
+        """
+        if not architectures:
+            return {}
+
+        # Batch custom ids must be short and alphanumeric, so index them
+        analyses = [self.analyzer.analyze(arch.main_tf) for arch in architectures]
+        messages = await self._run_batch({
+            f"probe-{i}": get_probe_prompt(probe_type, analysis, arch.main_tf)
+            for i, (arch, analysis) in enumerate(zip(architectures, analyses))
+        })
+
+        synthesized: dict[str, SynthesisResult] = {}
+        pending: dict[int, SynthesisResult] = {}
+        test_prompts: dict[str, list[dict[str, Any]]] = {}
+        for i, (arch, analysis) in enumerate(zip(architectures, analyses)):
+            message = messages.get(f"probe-{i}")
+            if message is None:
+                continue
+
+            result = SynthesisResult(
+                probe_type=probe_type,
+                probe_name=PROBE_CONFIGS[probe_type]["name"],
+                tokens_used=message.usage.input_tokens + message.usage.output_tokens,
+            )
+            synthesized[arch.id] = result
+
+            text = _message_text(message)
+            if text is None:
+                result.errors.append(f"Empty {probe_type.value} probe response")
+                continue
+
+            parsed = self._parse_json_response(text)
+            result.source_code = parsed.get("files", {})
+            result.requirements = parsed.get("requirements", [])
+            result.probed_features = parsed.get("probed_features", [])
+            result.probe_name = parsed.get("probe_name") or result.probe_name
+
+            if not result.source_code:
+                result.errors.append(f"Failed to generate {probe_type.value} probe code")
+                continue
+            pending[i] = result
+            app_code = _join_app_code(result.source_code)
+            test_prompts[f"tests-{i}"] = format_test_prompt(analysis, app_code)
+
+        # The probe code is already paid for, so a failed test batch keeps
+        # it (without tests, as the single-request path does)
+        test_messages: dict[str, Any] = {}
+        if test_prompts:
+            try:
+                test_messages = await self._run_batch(test_prompts)
+            except Exception as e:
+                logger.error("test_batch_failed", error=str(e))
+
+        for i, result in pending.items():
+            message = test_messages.get(f"tests-{i}")
+            text = _message_text(message) if message is not None else None
+            if text is not None:
+                parsed = self._parse_json_response(text)
+                result.test_code = parsed.get("files", {})
+                result.requirements.extend(parsed.get("requirements", []))
+            if message is not None:
+                result.tokens_used += message.usage.input_tokens + message.usage.output_tokens
+            result.requirements = list(set(result.requirements))
+
+            self._save_to_cache(architectures[i], analyses[i], result)
+
+        logger.info(
+            "batch_synthesis_completed",
+            architectures=len(architectures),
+            synthesized=len(synthesized),
+            successful=sum(1 for r in synthesized.values() if r.success),
+        )
+        return synthesized
+
+    async def _run_batch(self, prompts: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
+        """
+        Submit prompts as one message batch and wait for it to end.
+
+        Args:
+            prompts: User message content blocks per batch custom id
+
+        Returns:
+            Response message per custom id, for requests that succeeded
+        """
+        import asyncio
+
+        client = await self._get_client()
+        batch = await client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": MAX_OUTPUT_TOKENS,
+                        "temperature": CODE_GENERATION_TEMPERATURE,
+                        "system": [
+                            {
+                                "type": "text",
+                                "text": SYSTEM_PROMPT,
+                                "cache_control": {"type": "ephemeral"},
+                            }
+                        ],
+                        "messages": [{"role": "user", "content": prompt}],
+                    },
+                }
+                for custom_id, prompt in prompts.items()
+            ],
+        )
+        logger.info("batch_submitted", batch_id=batch.id, requests=len(prompts))
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(BATCH_POLL_INTERVAL_SECONDS)
+            batch = await client.messages.batches.retrieve(batch.id)
+
+        tracker = TokenTracker.get_instance()
+        messages: dict[str, Any] = {}
+        async for entry in await client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                tracker.record_from_response(entry.result.message.usage)
+                messages[entry.custom_id] = entry.result.message
+            else:
+                logger.warning(
+                    "batch_request_failed",
+                    batch_id=batch.id,
+                    custom_id=entry.custom_id,
+                    result=entry.result.type,
+                )
+
+        logger.info(
+            "batch_completed",
+            batch_id=batch.id,
+            succeeded=len(messages),
+            failed=len(prompts) - len(messages),
+        )
+        return messages
+
+    def _save_to_cache(
+        self,
+        architecture: Architecture,
+        analysis: InfrastructureAnalysis,
+        result: SynthesisResult,
+    ) -> None:
+        """Cache a successful probe app under the architecture's content key."""
+        if not self.cache or not result.success:
+            return
+
+        self.cache.save_app(
+            content_hash=self._cache_key(architecture, result.probe_type),
+            source_code=result.source_code,
+            test_code=result.test_code,
+            requirements=result.requirements,
+            metadata={
+                "architecture_id": architecture.id,
+                "probe_type": result.probe_type.value,
+                "probe_name": result.probe_name,
+                "probed_features": result.probed_features,
+                "services": list(analysis.services),
+            },
+        )
+
     async def _synthesize_probe(
         self,
         architecture: Architecture,
         analysis: InfrastructureAnalysis,
         probe_type: ProbeType,
+        terraform_content: Optional[str] = None,
     ) -> SynthesisResult:
         """
         Synthesize a single probe application.
@@ -314,6 +623,8 @@ class CodeSynthesizer:
             architecture: Source architecture
             analysis: Infrastructure analysis
             probe_type: Type of probe to generate
+            terraform_content: Terraform for the prompt, ideally pre-truncated
+                (default: the architecture's main.tf)
 
         Returns:
             SynthesisResult for this probe
@@ -321,7 +632,9 @@ class CodeSynthesizer:
         result = SynthesisResult(probe_type=probe_type)
 
         # Get probe-specific prompt
-        probe_prompt = get_probe_prompt(probe_type, analysis, architecture.main_tf)
+        if terraform_content is None:
+            terraform_content = architecture.main_tf
+        probe_prompt = get_probe_prompt(probe_type, analysis, terraform_content)
 
         # Generate probe source code
         source_result = await self._generate_probe_code(probe_prompt, probe_type)
@@ -336,7 +649,7 @@ class CodeSynthesizer:
             return result
 
         # Generate tests for this probe
-        app_code = "\n\n".join(result.source_code.values())
+        app_code = _join_app_code(result.source_code)
         test_result = await self._generate_tests(analysis, app_code)
         result.test_code = test_result.get("files", {})
         result.requirements.extend(test_result.get("requirements", []))
@@ -349,21 +662,21 @@ class CodeSynthesizer:
 
     async def _generate_probe_code(
         self,
-        prompt: str,
+        prompt: list[dict[str, Any]],
         probe_type: ProbeType,
     ) -> dict[str, Any]:
         """
         Generate probe code using Claude with best practices.
 
         Implements:
-        - Prompt caching for system prompt (90% cost reduction)
+        - Prompt caching for system prompt and probe instructions
         - Temperature control (0.3 for deterministic code)
         - Proper rate limit handling using retry-after header
         - Specific exception handling for different error types
         - Token usage tracking with cache metrics
 
         Args:
-            prompt: The probe-specific prompt
+            prompt: The probe-specific prompt content blocks
             probe_type: Type of probe
 
         Returns:
@@ -381,8 +694,7 @@ class CodeSynthesizer:
                 # Rate limit protection: Wait before making request
                 # This prevents burst patterns that trigger 429s
                 if attempt == 0:
-                    logger.debug("rate_limit_delay_before_request", delay=MIN_REQUEST_DELAY_SECONDS)
-                    await asyncio.sleep(MIN_REQUEST_DELAY_SECONDS)
+                    await self._wait_for_request_slot()
 
                 # Best practice: Use prompt caching for system prompt
                 # This reduces cost by up to 90% and latency by 85%
@@ -939,7 +1251,7 @@ class CodeSynthesizer:
                     if isinstance(files, dict) and files:
                         metadata = {
                             k: v for k, v in data.items()
-                            if k in ("requirements", "probed_features", "probe_name")
+                            if k in _RESPONSE_METADATA_KEYS
                         }
                         return files, metadata
             except json.JSONDecodeError:
@@ -955,7 +1267,7 @@ class CodeSynthesizer:
                     files = data["files"]
                     metadata = {
                         k: v for k, v in data.items()
-                        if k in ("requirements", "probed_features", "probe_name")
+                        if k in _RESPONSE_METADATA_KEYS
                     }
                     return files, metadata
         except json.JSONDecodeError:
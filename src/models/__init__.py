@@ -5,7 +5,6 @@ from src.models.architecture import (
     ArchitectureMetadata,
     ArchitectureSourceType,
     ArchitectureStatus,
-    ProbeType,
     SampleApp,
     SourceType,
     TemplateSource,
@@ -17,6 +16,7 @@ from src.models.coverage import (
     FailureTracker,
     ServiceCoverage,
 )
+from src.models.probe_type import ProbeType
 from src.models.results import (
     ArchitectureResult,
     InfrastructureResult,
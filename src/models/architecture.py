@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
+from src.models.probe_type import ProbeType
+
 
 class SourceType(Enum):
     """Type of template source."""
@@ -85,15 +87,6 @@ class ArchitectureStatus(Enum):
     READY = "ready"  # Has generated sample app, ready for validation
 
 
-class ProbeType(Enum):
-    """Type of probe application for discovering LocalStack gaps."""
-
-    API_PARITY = "api_parity"  # Tests advanced API parameters and response formats
-    EDGE_CASES = "edge_cases"  # Tests edge cases: large payloads, unicode, limits
-    INTEGRATION = "integration"  # Tests cross-service integrations and triggers
-    STRESS = "stress"  # Tests concurrent operations, race conditions, throttling
-
-
 class ArchitectureSourceType(Enum):
     """Origin type of an architecture."""
 
@@ -161,7 +154,7 @@ class ArchitectureMetadata:
             return "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class Architecture:
     """
     A normalized infrastructure template ready for validation.
@@ -0,0 +1,14 @@
+"""Probe type enum, kept in a leaf module so it imports without other models."""
+
+from __future__ import annotations
+
+from enum import Enum
+
+
+class ProbeType(Enum):
+    """Type of probe application for discovering LocalStack gaps."""
+
+    API_PARITY = "api_parity"  # Tests advanced API parameters and response formats
+    EDGE_CASES = "edge_cases"  # Tests edge cases: large payloads, unicode, limits
+    INTEGRATION = "integration"  # Tests cross-service integrations and triggers
+    STRESS = "stress"  # Tests concurrent operations, race conditions, throttling
@@ -192,6 +192,16 @@ class ValidationRun:
         if timing:
             self.timing = timing
 
+    @property
+    def architecture_results(self) -> list["ArchitectureResult"]:
+        """
+        Results that are full ArchitectureResult objects.
+
+        ``from_dict`` already converts serialized results, so this only
+        drops plain result IDs.
+        """
+        return [r for r in self.results if isinstance(r, ArchitectureResult)]
+
     def fail(self, error: str) -> None:
         """Mark the run as failed."""
         self.completed_at = datetime.now(timezone.utc)
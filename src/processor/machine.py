@@ -363,6 +363,20 @@ class ProcessingMachine:
 class ProcessingStats:
     """Statistics for processing run."""
 
+    __slots__ = (
+        "total",
+        "passed",
+        "partial",
+        "failed",
+        "errors",
+        "skipped",
+        "rate_limits",
+        "started_at",
+        "completed_at",
+        "start_perf",
+        "end_perf",
+    )
+
     def __init__(self) -> None:
         self.total: int = 0
         self.passed: int = 0
@@ -373,6 +387,9 @@ class ProcessingStats:
         self.rate_limits: int = 0
         self.started_at: Optional[datetime] = None
         self.completed_at: Optional[datetime] = None
+        # time.perf_counter() readings; process-local, so never persisted
+        self.start_perf: Optional[float] = None
+        self.end_perf: Optional[float] = None
 
     @property
     def completed(self) -> int:
@@ -386,6 +403,36 @@ class ProcessingStats:
             return 0.0
         return (self.passed / self.completed) * 100
 
+    @property
+    def elapsed_seconds(self) -> float:
+        """Run duration, from perf counters when available."""
+        if self.start_perf is not None and self.end_perf is not None:
+            return self.end_perf - self.start_perf
+        if self.started_at and self.completed_at:
+            return (self.completed_at - self.started_at).total_seconds()
+        return 0.0
+
+    def to_summary_dict(self) -> dict:
+        """Counts and pass rate, as reported in the run output."""
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "partial": self.partial,
+            "failed": self.failed,
+            "errors": self.errors,
+            "skipped": self.skipped,
+            "rate_limits": self.rate_limits,
+            "pass_rate": self.pass_rate,
+        }
+
+    def to_timing_dict(self) -> dict:
+        """Start/end timestamps and elapsed seconds."""
+        return {
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "total_seconds": self.elapsed_seconds,
+        }
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
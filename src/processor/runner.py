@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Optional
 
 from src.generator import CodeSynthesizer, CodeValidator, validate_all_files
@@ -15,7 +16,9 @@ from src.processor.states import ArchitectureState, ArchState, StateContext
 from src.registry import ArchitectureRegistry
 from src.runner.container import ContainerManager
 from src.runner.executor import ExecutionContext, PytestExecutor, TerraformExecutor
+from src.utils.atomic import atomic_write_bytes
 from src.utils.cache import AppCache, ArchitectureCache
+from src.utils.jsonio import dumps
 from src.utils.logging import get_logger
 from src.utils.tokens import TokenTracker
 
@@ -109,7 +112,7 @@ class ArchitectureProcessor:
         self._localstack_endpoint: Optional[str] = None
 
         # Run ID for this validation run
-        self._run_id = f"run-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
+        self._run_id = f"run-{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}"
 
     @property
     def synthesizer(self) -> CodeSynthesizer:
@@ -136,7 +139,8 @@ class ArchitectureProcessor:
         """
         import os
 
-        self.machine.stats.started_at = datetime.utcnow()
+        self.machine.stats.started_at = datetime.now(timezone.utc)
+        self.machine.stats.start_perf = perf_counter()
 
         logger.info(
             "processor_started",
@@ -181,7 +185,8 @@ class ArchitectureProcessor:
 
         finally:
             # Set completion time with validation
-            completed_at = datetime.utcnow()
+            self.machine.stats.end_perf = perf_counter()
+            completed_at = datetime.now(timezone.utc)
 
             # Validate timestamp consistency
             if self.machine.stats.started_at and completed_at < self.machine.stats.started_at:
@@ -810,6 +815,33 @@ class ArchitectureProcessor:
         """Get architecture discovery growth data."""
         return self.registry.get_growth_data(days)
 
+    def write_registry_to(self, path: Path, days: int = 30) -> dict:
+        """
+        Write registry stats, weekly summary and growth data as JSON.
+
+        The registry statistics are computed once and shared by the stats
+        and weekly summary sections.
+
+        Args:
+            path: Destination file (written atomically)
+            days: Number of days of growth data to include
+
+        Returns:
+            The registry statistics dict that was written
+        """
+        stats = self.registry.get_stats()
+        stats_dict = stats.to_dict()
+        atomic_write_bytes(
+            path,
+            dumps({
+                "stats": stats_dict,
+                "weekly_summary": self.registry.get_weekly_summary(stats),
+                "growth_data": self.registry.get_growth_data(days),
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            }),
+        )
+        return stats_dict
+
     def get_progress(self) -> dict[str, Any]:
         """Get current processing progress."""
         return {
@@ -412,14 +412,18 @@ class ArchitectureRegistry:
 
         return result
 
-    def get_weekly_summary(self) -> dict:
+    def get_weekly_summary(self, stats: Optional[RegistryStats] = None) -> dict:
         """
         Get weekly summary for team review.
 
+        Args:
+            stats: Precomputed registry statistics (computed if omitted)
+
         Returns:
             Summary dict with key metrics and action items
         """
-        stats = self.get_stats()
+        if stats is None:
+            stats = self.get_stats()
         new_this_week = self.get_new_since(7)
         failing = self.get_by_status("failed")
         partial = self.get_by_status("partial")
@@ -21,7 +21,7 @@ from src.reporter.notifications import (
     SlackNotifier,
     send_slack_notification,
 )
-from src.reporter.site import SiteGenerator
+from src.reporter.site import SiteGenerator, get_site_generator
 from src.reporter.trends import RunSummary, TrendAnalyzer, TrendData
 
 __all__ = [
@@ -39,6 +39,7 @@ __all__ = [
     "TrendData",
     # Site
     "SiteGenerator",
+    "get_site_generator",
     # Downloads
     "AppDownloadGenerator",
     # Issues
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,6 +16,7 @@ from src.utils.logging import get_logger
 if TYPE_CHECKING:
     from github import Github
     from github.Issue import Issue
+    from github.Repository import Repository
 
 logger = get_logger("reporter.issues")
 
@@ -27,6 +30,9 @@ LABELS = {
 # Consecutive failures required for issue creation
 CONSECUTIVE_FAILURES_THRESHOLD = 2
 
+# GitHub API calls allowed in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
 
 class FailureTrackerManager:
     """
@@ -344,6 +350,10 @@ class GitHubIssueManager:
         self.dry_run = dry_run
         self.formatter = IssueContentFormatter(dashboard_url)
         self._github: Optional["Github"] = None
+        self._repo: Optional["Repository"] = None
+        self._labels: Optional[set[str]] = None
+        self._label_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
         self._rate_limited = False
 
     def _get_client(self) -> "Github":
@@ -354,6 +364,13 @@ class GitHubIssueManager:
             self._github = Github(self.token)
         return self._github
 
+    def _get_repo(self) -> "Repository":
+        """Get the target repository, fetching it once per manager."""
+        with self._lock:
+            if self._repo is None:
+                self._repo = self._get_client().get_repo(self.repo)
+            return self._repo
+
     def _check_rate_limit(self) -> bool:
         """
         Check if we're rate limited.
@@ -426,8 +443,7 @@ class GitHubIssueManager:
             return None
 
         try:
-            client = self._get_client()
-            repo = client.get_repo(self.repo)
+            repo = self._get_repo()
 
             # Ensure labels exist
             self._ensure_labels_exist(repo, labels)
@@ -493,8 +509,7 @@ class GitHubIssueManager:
             return True
 
         try:
-            client = self._get_client()
-            repo = client.get_repo(self.repo)
+            repo = self._get_repo()
             issue = repo.get_issue(failure_entry.issue_number)
 
             # Check if already closed
@@ -530,35 +545,58 @@ class GitHubIssueManager:
             return False
 
     def _ensure_labels_exist(self, repo, labels: list[str]) -> None:
-        """Ensure all required labels exist in the repository."""
-        try:
-            existing_labels = {label.name for label in repo.get_labels()}
+        """
+        Ensure all required labels exist in the repository.
 
-            for label in labels:
-                if label not in existing_labels:
+        Each missing label is created under its own lock, so a concurrent
+        caller needing the same label waits for the creation instead of
+        assuming it already exists. A label is only recorded as known once
+        it has been created.
+        """
+        try:
+            with self._lock:
+                if self._labels is None:
+                    self._labels = {label.name for label in repo.get_labels()}
+                missing = [
+                    (label, self._label_locks.setdefault(label, threading.Lock()))
+                    for label in labels
+                    if label not in self._labels
+                ]
+
+            for label, label_lock in missing:
+                with label_lock:
+                    if label in self._labels:
+                        continue  # Created by another caller meanwhile
                     # Create with default color
                     color = "d73a4a" if label == "bug" else "0366d6"
                     try:
                         repo.create_label(name=label, color=color)
-                        logger.debug("label_created", label=label)
-                    except Exception:
-                        pass  # Label may have been created concurrently
+                    except Exception as e:
+                        logger.debug("label_create_failed", label=label, error=str(e))
+                        continue
+                    logger.debug("label_created", label=label)
+                    with self._lock:
+                        self._labels.add(label)
 
         except Exception as e:
             logger.warning("label_check_failed", error=str(e))
 
 
-def process_results_for_issues(
+async def process_results_for_issues(
     results: list[ArchitectureResult],
     data_dir: Path,
     github_token: Optional[str] = None,
     github_repo: Optional[str] = None,
     dashboard_url: str = "",
     dry_run: bool = False,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
 ) -> dict[str, int]:
     """
     Process validation results and manage issues.
 
+    Issue creation and closing run in worker threads, with at most
+    ``max_concurrency`` GitHub calls in flight at once.
+
     Args:
         results: List of architecture results
         data_dir: Directory for data files
@@ -566,6 +604,7 @@ def process_results_for_issues(
         github_repo: Repository in format "owner/repo" (optional)
         dashboard_url: Dashboard URL for links
         dry_run: If True, don't actually create/close issues
+        max_concurrency: Maximum concurrent GitHub API calls
 
     Returns:
         Dict with counts: {"created": N, "closed": N, "skipped": N}
@@ -598,20 +637,32 @@ def process_results_for_issues(
     # Create map of results by arch_id for lookup
     results_map = {r.architecture_id: r for r in results}
 
-    # Create issues for new failures
-    for entry in new_failures:
-        result = results_map.get(entry.architecture_id)
-        if result:
-            issue_number = issue_manager.create_issue(result, entry)
-            if issue_number:
-                entry.issue_number = issue_number
-                stats["created"] += 1
-            else:
-                stats["skipped"] += 1
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(func, *args):
+        async with semaphore:
+            return await asyncio.to_thread(func, *args)
+
+    # Create issues for new failures and close issues for recovered
+    to_create = [
+        (entry, results_map[entry.architecture_id])
+        for entry in new_failures
+        if entry.architecture_id in results_map
+    ]
+    outcomes = await asyncio.gather(
+        *(call(issue_manager.create_issue, result, entry) for entry, result in to_create),
+        *(call(issue_manager.close_issue, entry) for entry in recovered),
+    )
+
+    for (entry, _), issue_number in zip(to_create, outcomes):
+        if issue_number:
+            entry.issue_number = issue_number
+            stats["created"] += 1
+        else:
+            stats["skipped"] += 1
 
-    # Close issues for recovered
-    for entry in recovered:
-        if issue_manager.close_issue(entry):
+    for entry, closed in zip(recovered, outcomes[len(to_create):]):
+        if closed:
             entry.issue_number = None  # Clear the issue number
             stats["closed"] += 1
         else:
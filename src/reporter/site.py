@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import shutil
 from datetime import datetime, timedelta
@@ -16,6 +17,7 @@ from src.reporter.aggregator import ResultsAggregator
 from src.reporter.downloads import AppDownloadGenerator
 from src.reporter.storage import IndexBuilder, ObjectStore
 from src.reporter.trends import TrendAnalyzer
+from src.utils import jsonio
 from src.utils.atomic import atomic_write_json, atomic_write_text
 from src.utils.cache import AppCache
 from src.utils.logging import get_logger
@@ -304,7 +306,7 @@ class SiteGenerator:
         index_file = data_dir / "index.json"
         if index_file.exists():
             try:
-                index_data = json.loads(index_file.read_text())
+                index_data = jsonio.loads(index_file.read_bytes())
 
                 # Map CAS format to dashboard format
                 dashboard_data["run_id"] = index_data.get("latest_run", "")
@@ -349,7 +351,7 @@ class SiteGenerator:
         latest_file = data_dir / "latest.json"
         if latest_file.exists():
             try:
-                latest = json.loads(latest_file.read_text())
+                latest = jsonio.loads(latest_file.read_bytes())
                 dashboard_data["run_id"] = latest.get("id", "")
                 dashboard_data["localstack_version"] = latest.get(
                     "localstack_version", ""
@@ -413,7 +415,7 @@ class SiteGenerator:
         history_file = data_dir / "history.json"
         if history_file.exists():
             try:
-                history = json.loads(history_file.read_text())
+                history = jsonio.loads(history_file.read_bytes())
                 dashboard_data["trend_data"] = history.get("trend", {})
                 dashboard_data["run_history"] = history.get("runs", [])
             except (json.JSONDecodeError, KeyError) as e:
@@ -423,7 +425,7 @@ class SiteGenerator:
         registry_file = data_dir / "registry.json"
         if registry_file.exists():
             try:
-                registry = json.loads(registry_file.read_text())
+                registry = jsonio.loads(registry_file.read_bytes())
                 dashboard_data["registry_stats"] = registry.get("stats", {})
                 dashboard_data["weekly_summary"] = registry.get("weekly_summary", {})
                 dashboard_data["growth_data"] = registry.get("growth_data", [])
@@ -636,7 +638,7 @@ class SiteGenerator:
         }
 
         latest_file = data_dir / "latest.json"
-        latest_file.write_text(json.dumps(latest, indent=2, default=str))
+        latest_file.write_bytes(jsonio.dumps(latest))
         logger.info(
             "latest_json_saved",
             path=str(latest_file),
@@ -657,7 +659,7 @@ class SiteGenerator:
         runs_dir.mkdir(parents=True, exist_ok=True)
 
         run_file = runs_dir / f"{run.id}.json"
-        run_file.write_text(json.dumps(run.to_dict(), indent=2, default=str))
+        run_file.write_bytes(jsonio.dumps(run.to_dict()))
         logger.debug("run_json_saved", path=str(run_file))
 
     def _update_history(
@@ -707,7 +709,7 @@ class SiteGenerator:
         if runs_dir.exists():
             for run_file in sorted(runs_dir.glob("run-*.json"), reverse=True):
                 try:
-                    data = json.loads(run_file.read_text())
+                    data = jsonio.loads(run_file.read_bytes())
                     archives.append({
                         "id": data.get("id", run_file.stem),
                         "file": run_file.name,
@@ -952,3 +954,30 @@ class SiteGenerator:
         index_path.write_text(html)
 
         return index_path
+
+
+@functools.cache
+def get_site_generator(
+    templates_dir: Path,
+    output_dir: Path,
+    base_url: str = "",
+) -> SiteGenerator:
+    """
+    Get a shared SiteGenerator for the given directories.
+
+    Reusing the generator reuses its Jinja2 environment, so templates are
+    loaded and compiled once per process.
+
+    Args:
+        templates_dir: Directory containing Jinja2 templates
+        output_dir: Output directory for generated site
+        base_url: Base URL for assets and links
+
+    Returns:
+        SiteGenerator instance
+    """
+    return SiteGenerator(
+        templates_dir=templates_dir,
+        output_dir=output_dir,
+        base_url=base_url,
+    )
@@ -8,6 +8,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from src.utils import jsonio
 from src.utils.logging import get_logger
 
 logger = get_logger("reporter.trends")
@@ -91,7 +92,7 @@ class TrendAnalyzer:
         history_file = self.data_dir / "history.json"
         if history_file.exists():
             try:
-                data = json.loads(history_file.read_text())
+                data = jsonio.loads(history_file.read_bytes())
                 for run_data in data.get("runs", []):
                     runs.append(
                         RunSummary(
@@ -113,7 +114,7 @@ class TrendAnalyzer:
         if self.runs_dir.exists():
             for run_file in self.runs_dir.glob("run-*.json"):
                 try:
-                    run_data = json.loads(run_file.read_text())
+                    run_data = jsonio.loads(run_file.read_bytes())
                     run_id = run_data.get("id", run_file.stem)
 
                     # Skip if already loaded from history.json
@@ -237,7 +238,7 @@ class TrendAnalyzer:
         # Load existing history
         if history_file.exists():
             try:
-                data = json.loads(history_file.read_text())
+                data = jsonio.loads(history_file.read_bytes())
             except json.JSONDecodeError:
                 data = {"runs": [], "trend": {"labels": [], "pass_rates": [], "totals": []}}
         else:
@@ -257,7 +258,7 @@ class TrendAnalyzer:
 
         # Write back
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        history_file.write_text(json.dumps(data, indent=2))
+        history_file.write_bytes(jsonio.dumps(data))
 
         # Clear cache
         self._runs = None
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
+from time import perf_counter
 from typing import Optional
 
 from src.models import (
@@ -31,6 +31,7 @@ from src.runner.orchestrator import (
     ValidationTask,
     run_validation_pipeline,
 )
+from src.utils import jsonio
 from src.utils.cache import AppCache, ArchitectureCache
 from src.utils.logging import get_logger, set_run_context, set_stage
 
@@ -179,7 +180,7 @@ async def run_validations(
 
         # Run validations
         set_stage("validation")
-        validation_start = datetime.utcnow()
+        validation_start = perf_counter()
 
         run = await run_validation_pipeline(
             architectures=arch_list,
@@ -187,19 +188,15 @@ async def run_validations(
             config=config,
         )
 
-        result.timings.running_seconds = (
-            datetime.utcnow() - validation_start
-        ).total_seconds()
+        result.timings.running_seconds = perf_counter() - validation_start
 
         # Save results
         set_stage("reporting")
-        reporting_start = datetime.utcnow()
+        reporting_start = perf_counter()
 
         _save_run_results(run, output_dir)
 
-        result.timings.reporting_seconds = (
-            datetime.utcnow() - reporting_start
-        ).total_seconds()
+        result.timings.reporting_seconds = perf_counter() - reporting_start
 
         result.run = run
 
@@ -231,13 +228,16 @@ def _save_run_results(run: ValidationRun, output_dir: Path) -> None:
     runs_dir = data_dir / "runs"
     runs_dir.mkdir(parents=True, exist_ok=True)
 
+    # Serialize once; the run file and latest.json share the payload
+    payload = jsonio.dumps(run.to_dict())
+
     # Save run JSON
     run_file = runs_dir / f"{run.id}.json"
-    run_file.write_text(json.dumps(run.to_dict(), indent=2, default=str))
+    run_file.write_bytes(payload)
 
     # Update latest.json
     latest_file = data_dir / "latest.json"
-    latest_file.write_text(json.dumps(run.to_dict(), indent=2, default=str))
+    latest_file.write_bytes(payload)
 
     logger.debug("results_saved", run_id=run.id, path=str(run_file))
 
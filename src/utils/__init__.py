@@ -6,9 +6,13 @@ from src.utils.cache import (
     FileCache,
     get_cache_key,
     get_content_hash,
+    get_dir_size,
+    get_sizes_bulk,
+    scan_cache,
 )
 from src.utils.logging import (
     configure_logging,
+    defer_logging_config,
     get_correlation_id,
     get_logger,
     log_stage_timing,
@@ -26,6 +30,7 @@ from src.utils.tokens import (
 __all__ = [
     # Logging
     "configure_logging",
+    "defer_logging_config",
     "get_logger",
     "get_correlation_id",
     "set_correlation_id",
@@ -39,6 +44,9 @@ __all__ = [
     "AppCache",
     "get_cache_key",
     "get_content_hash",
+    "get_dir_size",
+    "get_sizes_bulk",
+    "scan_cache",
     # Tokens
     "TokenUsage",
     "TokenBudget",
@@ -5,9 +5,11 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
+from src.utils import jsonio
 from src.utils.atomic import atomic_write_json, atomic_write_text
 from src.utils.logging import get_logger
 
@@ -46,6 +48,106 @@ def get_content_hash(content: str) -> str:
     return hashlib.sha256(content.encode()).hexdigest()
 
 
+def get_dir_size(path: str | Path) -> int:
+    """
+    Get the total size of all files under a directory.
+
+    Walks the tree with ``os.scandir`` so each entry's type and size come
+    from the directory read instead of separate stat calls. Symlinks are
+    not followed.
+
+    Args:
+        path: Directory to measure
+
+    Returns:
+        Total size in bytes (0 if the directory does not exist)
+    """
+    total = 0
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return total
+
+
+def get_sizes_bulk(cache_dir: str | Path) -> dict[str, int]:
+    """
+    Measure every top-level cache bucket in one pass over the cache tree.
+
+    Each file is attributed to the top-level subdirectory it lives under
+    (e.g. ``architectures`` or ``apps``); files directly in ``cache_dir``
+    are counted under ``""``. Missing directories simply yield no entry.
+
+    Args:
+        cache_dir: Base cache directory (the one passed to the caches)
+
+    Returns:
+        Mapping of top-level subdirectory name to total size in bytes
+    """
+    sizes: dict[str, int] = {}
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    sizes[entry.name] = get_dir_size(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    sizes[""] = (
+                        sizes.get("", 0) + entry.stat(follow_symlinks=False).st_size
+                    )
+    except FileNotFoundError:
+        pass
+    return sizes
+
+
+def scan_cache(cache_dir: str | Path) -> tuple[int, int, int]:
+    """
+    Summarize the architecture and app caches in one walk.
+
+    Reads the cache directories directly rather than through
+    ``ArchitectureCache``/``AppCache`` so nothing is created on disk.
+
+    Args:
+        cache_dir: Base cache directory (the one passed to the caches)
+
+    Returns:
+        Tuple of (architecture count, app count, total size in bytes)
+    """
+    base = os.fspath(cache_dir)
+    counts = {"architectures": 0, "apps": 0}
+    total = 0
+    for subdir in counts:
+        try:
+            with os.scandir(os.path.join(base, subdir)) as entries:
+                for entry in entries:
+                    # Dot-entries (including atomic-write temp files) are
+                    # not cache keys, matching list_keys; they still count
+                    # toward the size, as in get_size
+                    if not entry.name.startswith("."):
+                        counts[subdir] += 1
+                    if entry.is_dir(follow_symlinks=False):
+                        total += get_dir_size(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except FileNotFoundError:
+            continue
+    return counts["architectures"], counts["apps"], total
+
+
+def _read_optional_text(path: Path) -> Optional[str]:
+    """Read a UTF-8 text file, returning None if it does not exist."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
 class FileCache:
     """
     File-based cache for storing and retrieving cached data.
@@ -140,7 +242,7 @@ class FileCache:
             return None
 
         try:
-            data = json.loads(content)
+            data = jsonio.loads(content)
         except json.JSONDecodeError as e:
             logger.warning("cache_json_error", key=key, error=str(e))
             return None
@@ -227,10 +329,17 @@ class FileCache:
             List of cache keys
         """
         search_dir = self.cache_dir / subdir if subdir else self.cache_dir
-        if not search_dir.exists():
-            return []
+        if pattern != "*":
+            if not search_dir.exists():
+                return []
+            return [p.name for p in search_dir.glob(pattern)]
 
-        return [p.name for p in search_dir.glob(pattern)]
+        # Plain listing: one scandir, no glob matching or existence check
+        try:
+            with os.scandir(search_dir) as entries:
+                return [e.name for e in entries if not e.name.startswith(".")]
+        except FileNotFoundError:
+            return []
 
     def get_size(self) -> int:
         """
@@ -239,11 +348,45 @@ class FileCache:
         Returns:
             Total size of all cached files
         """
-        total = 0
-        for path in self.cache_dir.rglob("*"):
-            if path.is_file():
-                total += path.stat().st_size
-        return total
+        return get_dir_size(self.cache_dir)
+
+    def _evict_oldest_dir(self) -> Optional[tuple[str, int]]:
+        """
+        Remove the least recently modified entry directory.
+
+        Returns:
+            (entry name, bytes freed), or None if nothing was removed
+        """
+        import shutil
+
+        oldest_path = None
+        oldest_time = None
+
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        mtime = entry.stat(follow_symlinks=False).st_mtime
+                    except OSError:
+                        continue
+                    if oldest_time is None or mtime < oldest_time:
+                        oldest_time = mtime
+                        oldest_path = entry.path
+        except FileNotFoundError:
+            return None
+
+        if oldest_path is None:
+            return None
+
+        size = get_dir_size(oldest_path)
+        try:
+            shutil.rmtree(oldest_path)
+        except OSError as e:
+            logger.warning("eviction_failed", path=oldest_path, error=str(e))
+            return None
+        return os.path.basename(oldest_path), size
 
     def clear(self, subdir: str = "") -> int:
         """
@@ -409,73 +552,117 @@ class ArchitectureCache(FileCache):
             source_type, source_name, source_url
         """
         arch_dir = self.cache_dir / arch_id
-        if not arch_dir.exists():
-            return None
-
-        main_tf_path = arch_dir / "main.tf"
-        if not main_tf_path.exists():
+        try:
+            main_tf = (arch_dir / "main.tf").read_text(encoding="utf-8")
+        except (FileNotFoundError, NotADirectoryError):
             return None
 
         result: dict[str, Any] = {
-            "main_tf": main_tf_path.read_text(encoding="utf-8"),
-            "variables_tf": None,
-            "outputs_tf": None,
+            "main_tf": main_tf,
+            "variables_tf": _read_optional_text(arch_dir / "variables.tf"),
+            "outputs_tf": _read_optional_text(arch_dir / "outputs.tf"),
             "metadata": None,
             "source_type": None,
             "source_name": None,
             "source_url": None,
         }
 
-        variables_path = arch_dir / "variables.tf"
-        if variables_path.exists():
-            result["variables_tf"] = variables_path.read_text(encoding="utf-8")
-
-        outputs_path = arch_dir / "outputs.tf"
-        if outputs_path.exists():
-            result["outputs_tf"] = outputs_path.read_text(encoding="utf-8")
+        try:
+            metadata_bytes = (arch_dir / "metadata.json").read_bytes()
+        except FileNotFoundError:
+            return result
 
-        metadata_path = arch_dir / "metadata.json"
-        if metadata_path.exists():
-            metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
-            result["metadata"] = metadata
-            # Extract source info from metadata for convenience
-            result["source_type"] = metadata.get("source_type")
-            result["source_name"] = metadata.get("source_name")
-            result["source_url"] = metadata.get("source_url")
+        metadata = jsonio.loads(metadata_bytes)
+        result["metadata"] = metadata
+        # Extract source info from metadata for convenience
+        result["source_type"] = metadata.get("source_type")
+        result["source_name"] = metadata.get("source_name")
+        result["source_url"] = metadata.get("source_url")
 
         return result
 
-    def evict_oldest(self) -> bool:
+    def iter_needs_generation(
+        self,
+        app_cache: AppCache,
+        app_key: Callable[[str, dict], Optional[str]],
+        arch_ids: Optional[Iterable[str]] = None,
+    ) -> Iterator[str]:
         """
-        Evict the oldest architecture from cache.
+        Yield cached architectures that have no generated app yet.
 
-        Returns:
-            True if an entry was evicted
+        Only each architecture's ``metadata.json`` is read here; ``app_key``
+        decides whether that is enough to derive the key (e.g. a recorded
+        content hash) or the full architecture has to be loaded.
+
+        Args:
+            app_cache: Cache holding generated apps
+            app_key: Maps an architecture ID and its metadata (empty if
+                missing or unreadable) to its app-cache key, or None if it
+                cannot be derived
+            arch_ids: Architectures to check (default: every cached one)
+
+        Yields:
+            IDs whose app is not cached or whose key cannot be derived
         """
-        import shutil
+        for arch_id in self.list_keys() if arch_ids is None else arch_ids:
+            try:
+                metadata = jsonio.loads(
+                    (self.cache_dir / arch_id / "metadata.json").read_bytes()
+                )
+            except (FileNotFoundError, NotADirectoryError, ValueError):
+                metadata = {}
+            key = app_key(arch_id, metadata if isinstance(metadata, dict) else {})
+            if key is None or not app_cache.app_exists(key):
+                yield arch_id
 
-        oldest_path = None
-        oldest_time = None
+    def load_all(
+        self,
+        arch_ids: Iterable[str],
+        max_workers: Optional[int] = None,
+    ) -> Iterator[tuple[str, dict]]:
+        """
+        Load many architectures, overlapping their file reads.
 
-        for path in self.cache_dir.iterdir():
-            if path.is_dir():
-                try:
-                    mtime = path.stat().st_mtime
-                    if oldest_time is None or mtime < oldest_time:
-                        oldest_time = mtime
-                        oldest_path = path
-                except OSError:
-                    continue
+        Args:
+            arch_ids: Architecture identifiers
+            max_workers: Maximum number of reader threads
+                (default: four per CPU, capped at 32)
 
-        if oldest_path:
+        Yields:
+            (arch_id, architecture dict) pairs in input order; ids that
+            are not cached or fail to load are skipped
+        """
+        ids = list(arch_ids)
+        if not ids:
+            return
+
+        def load(arch_id: str) -> Optional[dict]:
             try:
-                shutil.rmtree(oldest_path)
-                logger.debug("architecture_evicted", arch_id=oldest_path.name)
-                return True
-            except OSError as e:
-                logger.warning("eviction_failed", path=str(oldest_path), error=str(e))
+                return self.load_architecture(arch_id)
+            except Exception as e:
+                logger.warning("architecture_load_error", arch_id=arch_id, error=str(e))
+                return None
 
-        return False
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as executor:
+            for arch_id, cached in zip(ids, executor.map(load, ids)):
+                if cached is not None:
+                    yield arch_id, cached
+
+    def evict_oldest(self) -> Optional[tuple[str, int]]:
+        """
+        Evict the oldest architecture from cache.
+
+        Returns:
+            (arch_id, bytes_freed) for the evicted entry, or None if
+            nothing was evicted
+        """
+        evicted = self._evict_oldest_dir()
+        if evicted:
+            logger.debug("architecture_evicted", arch_id=evicted[0])
+        return evicted
 
 
 class AppCache(FileCache):
@@ -590,34 +777,15 @@ class AppCache(FileCache):
 
         return result
 
-    def evict_oldest(self) -> bool:
+    def evict_oldest(self) -> Optional[tuple[str, int]]:
         """
         Evict the oldest app from cache.
 
         Returns:
-            True if an entry was evicted
+            (content_hash, bytes_freed) for the evicted entry, or None if
+            nothing was evicted
         """
-        import shutil
-
-        oldest_path = None
-        oldest_time = None
-
-        for path in self.cache_dir.iterdir():
-            if path.is_dir():
-                try:
-                    mtime = path.stat().st_mtime
-                    if oldest_time is None or mtime < oldest_time:
-                        oldest_time = mtime
-                        oldest_path = path
-                except OSError:
-                    continue
-
-        if oldest_path:
-            try:
-                shutil.rmtree(oldest_path)
-                logger.debug("app_evicted", content_hash=oldest_path.name)
-                return True
-            except OSError as e:
-                logger.warning("eviction_failed", path=str(oldest_path), error=str(e))
-
-        return False
+        evicted = self._evict_oldest_dir()
+        if evicted:
+            logger.debug("app_evicted", content_hash=evicted[0])
+        return evicted
@@ -0,0 +1,67 @@
+"""Fast JSON encoding and decoding.
+
+Uses orjson when it is installed and falls back to the standard library
+``json`` module otherwise. Both paths produce UTF-8 encoded bytes so callers
+can write the result straight to a binary stream or file.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(data: Any, indent: bool = True, newline: bool = False) -> bytes:
+    """
+    Serialize data to JSON bytes.
+
+    Non-serializable values are converted with ``str``.
+
+    Args:
+        data: Object to serialize
+        indent: Pretty-print with two-space indentation
+        newline: Append a trailing newline
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(data, default=str, option=option)
+
+    text = json.dumps(
+        data,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        default=str,
+    )
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize JSON from bytes or str.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
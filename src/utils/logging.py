@@ -16,6 +16,9 @@ correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="")
 run_id_var: ContextVar[str] = ContextVar("run_id", default="")
 stage_var: ContextVar[str] = ContextVar("stage", default="")
 
+# Settings to apply when a logger is first used, or None once configured
+_pending_config: dict[str, Any] | None = {"level": "info", "format_type": "json"}
+
 
 def get_correlation_id() -> str:
     """Get the current correlation ID, generating one if not set."""
@@ -87,6 +90,9 @@ def configure_logging(
         format_type: Output format ('json' or 'text')
         stream: Output stream (default: sys.stderr)
     """
+    global _pending_config
+    _pending_config = None
+
     if stream is None:
         stream = sys.stderr
 
@@ -133,20 +139,69 @@ def configure_logging(
     )
 
 
-def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
+def defer_logging_config(
+    level: str = "info",
+    format_type: str = "json",
+    stream: Any = None,
+) -> None:
+    """
+    Record logging settings to apply when a logger is first requested.
+
+    Paths that never log (``--help``, ``--version``, quiet commands) then
+    skip building the structlog processor chain entirely.
+
+    Args:
+        level: Log level (debug, info, warn, error)
+        format_type: Output format ('json' or 'text')
+        stream: Output stream (default: sys.stderr)
+    """
+    global _pending_config
+    _pending_config = {"level": level, "format_type": format_type, "stream": stream}
+
+
+class _LazyLogger:
+    """
+    Logger handle that resolves on first use.
+
+    Module-level ``logger = get_logger(...)`` assignments run at import, so
+    resolving there would apply the logging configuration before the CLI
+    has parsed its options (and on paths that never log at all).
+    """
+
+    __slots__ = ("_name", "_logger")
+
+    def __init__(self, name: str | None) -> None:
+        self._name = name
+        self._logger: Any = None
+
+    def _resolve(self) -> Any:
+        if self._logger is None:
+            if _pending_config is not None:
+                configure_logging(**_pending_config)
+            logger = structlog.get_logger()
+            if self._name:
+                logger = logger.bind(logger_name=self._name)
+            self._logger = logger
+        return self._logger
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+
+
+def get_logger(name: str | None = None) -> _LazyLogger:
     """
-    Get a configured logger instance.
+    Get a logger instance.
+
+    Configuration (including settings recorded by defer_logging_config)
+    is applied when the logger is first used, not when it is requested.
 
     Args:
         name: Optional logger name for context
 
     Returns:
-        Configured structlog logger
+        Structlog logger proxy
     """
-    logger = structlog.get_logger()
-    if name:
-        logger = logger.bind(logger_name=name)
-    return logger
+    return _LazyLogger(name)
 
 
 class LogContext:
@@ -191,7 +246,3 @@ def log_validation_result(
         tests_passed=tests_passed,
         tests_failed=tests_failed,
     )
-
-
-# Initialize with defaults on import
-configure_logging()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -172,6 +173,11 @@ class TokenTracker:
     def __init__(self, budget: int = 500000) -> None:
         """Initialize the tracker with a budget."""
         self._budget = TokenBudget(budget=budget)
+        # Set once the budget runs out, so concurrent workers can stop
+        # without re-deriving it from the usage totals
+        self.exhausted_event = asyncio.Event()
+        if self._budget.exhausted:
+            self.exhausted_event.set()
 
     @classmethod
     def get_instance(cls, budget: Optional[int] = None) -> "TokenTracker":
@@ -234,6 +240,8 @@ class TokenTracker:
             cache_write_tokens=cache_write_tokens,
         )
         self._budget.record_usage(usage)
+        if self._budget.exhausted:
+            self.exhausted_event.set()
 
     def record_from_response(self, usage) -> None:
         """